@@ -1,3 +1,3 @@
-from .vad import VADProcessor
+from .vad import VADProcessor, acquire_vad, release_vad
 
-__all__ = ["VADProcessor"]
+__all__ = ["VADProcessor", "acquire_vad", "release_vad"]
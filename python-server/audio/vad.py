@@ -2,12 +2,25 @@
 Voice Activity Detection (VAD) - WebRTC VAD
 """
 
+import queue
+from collections import deque
 from typing import Tuple
 import numpy as np
 import webrtcvad
 
 from config import Config
 
+try:
+    import xxhash
+    _frame_hash = xxhash.xxh3_64_intdigest
+    XXHASH_AVAILABLE = True
+except ImportError:
+    _frame_hash = hash  # bytes-like에 대한 siphash 폴백
+    XXHASH_AVAILABLE = False
+
+# 프레임 판정 캐시 크기 (960바이트 × 2048 프레임 ≈ 61초 분량의 고유 프레임)
+_VAD_CACHE_SIZE = 2048
+
 
 class VADProcessor:
     """
@@ -37,12 +50,89 @@ class VADProcessor:
         self.min_speech_frames = 3    # 최소 음성 프레임 (노이즈 필터링)
         self.max_silence_frames = int(Config.SILENCE_DURATION_MS / self.frame_duration_ms)  # 400ms / 30ms = 13 프레임
 
+        # 프레임 해시 → VAD 판정 캐시 (침묵 꼬리처럼 바이트가 동일한 프레임 재판정 방지)
+        self._vad_cache = {}
+        self._vad_cache_order = deque(maxlen=_VAD_CACHE_SIZE)
+
+        # 직전 청크의 프레임 판정 memo: process_chunk() 직후 filter_speech()가
+        # 같은 bytes 객체로 호출되므로 두 번째 순회를 통째로 생략한다
+        self._last_chunk = None
+        self._last_flags = None
+
+        # webrtcvad가 buffer protocol을 받으면 프레임마다 bytes 복사를 생략할 수 있음
+        try:
+            self.vad.is_speech(memoryview(b"\x00" * self.frame_size), self.sample_rate)
+            self._vad_accepts_buffer = True
+        except Exception:
+            self._vad_accepts_buffer = False
+
     def calculate_rms(self, audio_bytes: bytes) -> float:
         """int16 오디오 데이터의 RMS 계산"""
         if len(audio_bytes) < 2:
             return 0.0
         arr = np.frombuffer(audio_bytes, dtype=np.int16)
-        return float(np.sqrt(np.mean(arr.astype(np.float64) ** 2)))
+        # int64 누적 곱: float64 변환 임시 배열 없이 정확한 제곱합 (int16²은 오버플로 없음)
+        sq = np.multiply(arr, arr, dtype=np.int64)
+        return float(np.sqrt(sq.mean()))
+
+    def _frame_rms_all(self, audio_bytes: bytes, n_frames: int) -> np.ndarray:
+        """
+        모든 프레임의 RMS를 한 번의 벡터 연산으로 계산
+
+        int64 누적 곱으로 float64 임시 배열 없이 프레임별 RMS를 구한다.
+        """
+        samples_per_frame = self.frame_size // 2
+        arr = np.frombuffer(audio_bytes, dtype=np.int16)[:n_frames * samples_per_frame]
+        frames = arr.reshape(n_frames, samples_per_frame)
+        sq = np.multiply(frames, frames, dtype=np.int64)
+        return np.sqrt(sq.mean(axis=1))
+
+    def _frame_speech_flags(self, audio_bytes: bytes) -> np.ndarray:
+        """
+        프레임별 음성 여부 판정
+
+        프레임마다 bytes를 새로 만드는 대신 memoryview 슬라이스를 VAD에 넘기고,
+        VAD 실패 프레임은 벡터화된 per-frame RMS로 폴백한다.
+        """
+        if audio_bytes is self._last_chunk:
+            return self._last_flags
+
+        fs = self.frame_size
+        n_frames = len(audio_bytes) // fs
+        flags = np.zeros(n_frames, dtype=bool)
+
+        buf = memoryview(audio_bytes) if self._vad_accepts_buffer else audio_bytes
+        frame_rms = None
+        cache = self._vad_cache
+        order = self._vad_cache_order
+
+        for i in range(n_frames):
+            frame = buf[i * fs:(i + 1) * fs]
+
+            h = _frame_hash(frame)
+            cached = cache.get(h)
+            if cached is not None:
+                flags[i] = cached
+                continue
+
+            try:
+                verdict = self.vad.is_speech(frame, self.sample_rate)
+            except Exception:
+                # VAD 오류 시 RMS 폴백 (최초 1회만 전체 프레임 RMS를 일괄 계산)
+                if frame_rms is None:
+                    frame_rms = self._frame_rms_all(audio_bytes, n_frames)
+                flags[i] = frame_rms[i] >= Config.SILENCE_THRESHOLD_RMS
+                continue
+
+            flags[i] = verdict
+            if len(cache) >= _VAD_CACHE_SIZE and order:
+                cache.pop(order.popleft(), None)
+            cache[h] = verdict
+            order.append(h)
+
+        self._last_chunk = audio_bytes
+        self._last_flags = flags
+        return flags
 
     def has_speech(self, audio_bytes: bytes) -> bool:
         """
@@ -57,27 +147,12 @@ class VADProcessor:
         if len(audio_bytes) < self.frame_size:
             return False
 
-        speech_frame_count = 0
-        total_frames = 0
-
-        for i in range(0, len(audio_bytes) - self.frame_size + 1, self.frame_size):
-            frame = audio_bytes[i:i + self.frame_size]
-            if len(frame) == self.frame_size:
-                total_frames += 1
-                try:
-                    if self.vad.is_speech(frame, self.sample_rate):
-                        speech_frame_count += 1
-                except Exception:
-                    # VAD 오류 시 RMS 폴백
-                    rms = self.calculate_rms(frame)
-                    if rms >= Config.SILENCE_THRESHOLD_RMS:
-                        speech_frame_count += 1
+        flags = self._frame_speech_flags(audio_bytes)
+        if flags.size == 0:
+            return False
 
         # 30% 이상의 프레임이 음성이면 음성으로 판단
-        if total_frames > 0:
-            speech_ratio = speech_frame_count / total_frames
-            return speech_ratio >= 0.3
-        return False
+        return int(flags.sum()) / flags.size >= 0.3
 
     def filter_speech(self, audio_bytes: bytes) -> bytes:
         """
@@ -92,23 +167,17 @@ class VADProcessor:
         if len(audio_bytes) < self.frame_size:
             return audio_bytes
 
-        speech_frames = []
+        flags = self._frame_speech_flags(audio_bytes)
+        if not flags.any():
+            return b''
 
-        for i in range(0, len(audio_bytes) - self.frame_size + 1, self.frame_size):
-            frame = audio_bytes[i:i + self.frame_size]
-            if len(frame) == self.frame_size:
-                try:
-                    if self.vad.is_speech(frame, self.sample_rate):
-                        speech_frames.append(frame)
-                except Exception:
-                    # VAD 오류 시 RMS 폴백
-                    rms = self.calculate_rms(frame)
-                    if rms >= Config.SILENCE_THRESHOLD_RMS:
-                        speech_frames.append(frame)
+        fs = self.frame_size
+        if flags.all():
+            # 전 프레임이 음성이면 join 없이 한 번에 잘라냄
+            return audio_bytes[:flags.size * fs]
 
-        if speech_frames:
-            return b''.join(speech_frames)
-        return b''
+        mv = memoryview(audio_bytes)
+        return b''.join(mv[i * fs:(i + 1) * fs] for i in np.flatnonzero(flags))
 
     def process_chunk(self, audio_bytes: bytes) -> Tuple[bool, bool]:
         """
@@ -141,3 +210,30 @@ class VADProcessor:
         self.is_speaking = False
         self.silence_frames = 0
         self.speech_frames = 0
+        self._last_chunk = None
+        self._last_flags = None
+
+
+# ==============================================================================
+# VADProcessor free-list 풀
+# 세션 생성/종료가 잦은 방에서 webrtcvad.Vad C 객체 재생성을 피하고,
+# 재사용 시 프레임 판정 캐시도 함께 이어받는다.
+# ==============================================================================
+_VAD_POOL: queue.SimpleQueue = queue.SimpleQueue()
+_VAD_POOL_MAX = 64
+
+
+def acquire_vad() -> VADProcessor:
+    """풀에서 VADProcessor를 꺼내거나 (비어 있으면) 새로 생성"""
+    try:
+        vad = _VAD_POOL.get_nowait()
+    except queue.Empty:
+        return VADProcessor()
+    vad.reset()
+    return vad
+
+
+def release_vad(vad: VADProcessor):
+    """세션 종료 시 VADProcessor를 풀에 반납 (상한 초과분은 GC에 맡김)"""
+    if vad is not None and _VAD_POOL.qsize() < _VAD_POOL_MAX:
+        _VAD_POOL.put(vad)
@@ -1,4 +1,4 @@
 """Cache module - Room-based caching for STT/Translation/TTS"""
-from cache.room_cache import CacheEntry, RoomCacheManager
+from cache.room_cache import CacheEntry, RoomCacheManager, STTCoalescer, make_audio_hasher
 
-__all__ = ["CacheEntry", "RoomCacheManager"]
+__all__ = ["CacheEntry", "RoomCacheManager", "STTCoalescer", "make_audio_hasher"]
@@ -8,8 +8,10 @@ Room-based Cache Manager - STT/Translation/TTS 결과 캐싱
 """
 
 import time
+import heapq
 import threading
 import hashlib
+from concurrent.futures import Future
 from typing import Dict, Set, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
@@ -17,16 +19,142 @@ from collections import defaultdict
 from config.settings import Config
 from utils.logger import DebugLogger
 
+# Optional: xxHash3 (SIMD C 구현, MD5 대비 수 배 빠른 비암호화 해시)
+# xxh3_64는 큰 입력에서 GIL을 해제하므로 48KB 오디오 해싱 중에도
+# 다른 워커 스레드가 실행될 수 있다
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
-@dataclass
+
+class _Blake2bHasher:
+    """xxhash 미설치 시 intdigest() 인터페이스를 맞추는 blake2b 폴백"""
+    __slots__ = ("_hasher",)
+
+    def __init__(self):
+        self._hasher = hashlib.blake2b(digest_size=8)
+
+    def update(self, data: bytes):
+        self._hasher.update(data)
+
+    def intdigest(self) -> int:
+        return int.from_bytes(self._hasher.digest(), "big")
+
+
+def make_audio_hasher():
+    """스트리밍 오디오 버퍼용 증분 해셔 생성
+
+    버퍼 소유자가 프레임 도착 시마다 .update(frame)을 호출하고,
+    처리 시점에 .intdigest()를 get_or_create_stt의 audio_hash로 전달하면
+    전체 버퍼를 다시 해싱하지 않아도 된다 (O(전체) → O(신규 바이트)).
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64()
+    return _Blake2bHasher()
+
+
+class STTCoalescer:
+    """동일 화자의 연속 STT 요청 병합
+
+    같은 (room_id, speaker_id) 요청이 처리 중일 때 도착한 요청은
+    'latest' 슬롯을 덮어쓰고 공유 Future를 기다린다. 처리를 마친
+    스레드가 슬롯의 최신 오디오만 이어서 처리하므로, VAD 윈도우가
+    겹쳐 몇 샘플만 다른 중간 버퍼는 STT 백엔드를 타지 않는다.
+    """
+    __slots__ = ("_lock", "_inflight", "_latest")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 처리 중인 (room_id, speaker_id) 집합
+        self._inflight: Set[tuple] = set()
+        # (room_id, speaker_id) -> (audio_bytes, audio_hash, Future)
+        self._latest: Dict[tuple, tuple] = {}
+
+    def submit(self, key: tuple, audio_bytes: bytes, audio_hash: int, process_fn):
+        """process_fn(audio_bytes, audio_hash)을 실행하거나 병합 결과를 공유"""
+        with self._lock:
+            if key in self._inflight:
+                prev = self._latest.get(key)
+                future = prev[2] if prev is not None else Future()
+                self._latest[key] = (audio_bytes, audio_hash, future)
+            else:
+                self._inflight.add(key)
+                future = None
+
+        if future is not None:
+            # 처리 중 → 내 오디오가 최신 슬롯을 덮어썼고 그 결과를 공유
+            return future.result(timeout=Config.STT_TIMEOUT)
+
+        error = None
+        result = None
+        try:
+            result = process_fn(audio_bytes, audio_hash)
+        except BaseException as e:
+            error = e
+
+        # 내 처리 동안 쌓인 최신 요청을 이어서 처리한 뒤 in-flight 해제
+        while True:
+            with self._lock:
+                pending = self._latest.pop(key, None)
+                if pending is None:
+                    self._inflight.discard(key)
+                    break
+            latest_bytes, latest_hash, fut = pending
+            try:
+                fut.set_result(process_fn(latest_bytes, latest_hash))
+            except BaseException as e:
+                fut.set_exception(e)
+
+        if error is not None:
+            raise error
+        return result
+
+
+@dataclass(slots=True)
 class CacheEntry:
-    """캐시 엔트리"""
+    """캐시 엔트리 (created_at은 time.monotonic 기준 — NTP 점프에 영향 없음)
+
+    slots=True: 쓰기마다 할당되는 객체이므로 __dict__ 없이
+    고정 슬롯으로 메모리를 줄이고 속성 접근도 빨라진다.
+    """
     value: any
     created_at: float
     ttl: float = Config.CACHE_TTL_SECONDS
 
-    def is_expired(self) -> bool:
-        return time.time() - self.created_at > self.ttl
+    def is_expired(self, now: float = None) -> bool:
+        """now를 전달하면 호출자가 캡처한 시각을 재사용 (시계 호출 절약)"""
+        if now is None:
+            now = time.monotonic()
+        return now - self.created_at > self.ttl
+
+
+class _CacheShard:
+    """락 스트라이핑용 캐시 샤드
+
+    샤드마다 독립된 락과 캐시 딕셔너리를 가져
+    워커 수에 따라 캐시 조회가 거의 선형으로 확장된다.
+    """
+    __slots__ = ("lock", "stt", "translation", "tts", "pending", "expiry_heap",
+                 "entry_count")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # 샤드 내 전체 캐시 엔트리 수 (용량 상한 집행용)
+        self.entry_count = 0
+        # (room_id, speaker_id, audio_hash) -> CacheEntry
+        # 중첩 defaultdict 대신 평탄한 복합 키: 조회당 해시 연산 1회,
+        # 미스 시 내부 dict 자동 할당도 없음
+        self.stt: Dict[Tuple[str, str, int], CacheEntry] = {}
+        # (room_id, source_lang, target_lang, text_hash) -> CacheEntry
+        self.translation: Dict[tuple, CacheEntry] = {}
+        # (room_id, "tts", target_lang, text_hash) -> CacheEntry
+        self.tts: Dict[tuple, CacheEntry] = {}
+        # single-flight: 동일 키 처리 중이면 승자의 Future를 공유
+        self.pending: Dict[tuple, Future] = {}
+        # (만료 시각, 캐시 이름, 키) 최소 힙 — 만료된 키만 O(log N)으로 제거
+        self.expiry_heap: list = []
 
 
 class RoomCacheManager:
@@ -39,6 +167,12 @@ class RoomCacheManager:
     _instance = None
     _lock = threading.Lock()
 
+    # 락 스트라이핑 샤드 수 (2의 거듭제곱이어야 마스킹 선택 가능)
+    N_SHARDS = 16
+
+    # 샤드당 엔트리 상한 — 초과 시 가장 오래된 엔트리부터 제거
+    _MAX_ENTRIES_PER_SHARD = max(1, Config.CACHE_MAX_ENTRIES // N_SHARDS)
+
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
@@ -51,142 +185,248 @@ class RoomCacheManager:
         if self._initialized:
             return
 
-        # room_id -> speaker_id -> cache_key -> CacheEntry
-        self.stt_cache: Dict[str, Dict[str, Dict[str, CacheEntry]]] = defaultdict(lambda: defaultdict(dict))
-        self.translation_cache: Dict[str, Dict[str, CacheEntry]] = defaultdict(dict)
-        self.tts_cache: Dict[str, Dict[str, CacheEntry]] = defaultdict(dict)
+        # cache_key 해시로 선택되는 독립 샤드 (stt/translation/tts/pending)
+        self._shards = [_CacheShard() for _ in range(self.N_SHARDS)]
 
-        # 리스너 관리: room_id -> target_lang -> set of listener_ids
-        self.room_listeners: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        # 리스너 관리: room_id -> target_lang -> frozenset of listener_ids
+        # copy-on-write: 쓰기는 락 아래에서 새 frozenset을 만들어 대입하고,
+        # 읽기는 불변 스냅샷을 락/복사 없이 그대로 반환
+        self.room_listeners: Dict[str, Dict[str, frozenset]] = {}
+        self._listener_lock = threading.Lock()
 
-        # 결과 대기 큐: 동일 요청이 처리 중일 때 대기
-        self.pending_requests: Dict[str, threading.Event] = {}
-
-        self._cache_lock = threading.Lock()
         self._initialized = True
 
-        # 주기적 캐시 정리 스레드 시작
+        # 만료 힙 기반 캐시 정리 스레드 시작
+        self._cleanup_wakeup = threading.Event()
         self._cleanup_thread = threading.Thread(target=self._cleanup_loop, daemon=True)
         self._cleanup_thread.start()
 
-        DebugLogger.log("CACHE", "RoomCacheManager initialized")
+        DebugLogger.log("CACHE", f"RoomCacheManager initialized ({self.N_SHARDS} shards)")
+
+    def _get_shard(self, cache_key) -> _CacheShard:
+        """캐시 키 해시로 담당 샤드 선택
+
+        튜플 키는 내장 hash가 원소 해시를 병합하는 C 경로라 충분히 빠르고,
+        샤드 선택은 프로세스 내부용이므로 해시 안정성이 필요 없다.
+        """
+        return self._shards[hash(cache_key) & (self.N_SHARDS - 1)]
 
     def _cleanup_loop(self):
-        """주기적으로 만료된 캐시 정리"""
+        """다음 만료 시각까지만 대기했다가 만료된 키만 제거
+
+        데몬 스레드가 한 번의 예외로 죽으면 프로세스 수명 동안 만료 정리가
+        영구 중단되므로, 반복 단위로 기록만 하고 루프를 유지한다.
+        """
         while True:
-            time.sleep(Config.CACHE_CLEANUP_INTERVAL)
-            self._cleanup_expired()
+            try:
+                self._cleanup_wakeup.wait(timeout=self._next_expiry_timeout())
+                self._cleanup_wakeup.clear()
+                self._cleanup_expired()
+            except Exception as e:
+                DebugLogger.log("CACHE_CLEANUP_ERROR", f"Cleanup iteration failed: {e}")
+
+    def _next_expiry_timeout(self) -> float:
+        """가장 가까운 만료 시각까지의 대기 시간 (힙이 비면 기본 간격)"""
+        now = time.monotonic()
+        nearest = None
+        for shard in self._shards:
+            # 워커가 샤드 락 아래에서 같은 힙을 pop하므로 head 읽기도 락 필요
+            # (비어있는지 검사와 [0] 접근 사이에 pop되면 IndexError)
+            with shard.lock:
+                heap = shard.expiry_heap
+                deadline = heap[0][0] if heap else None
+            if deadline is not None and (nearest is None or deadline < nearest):
+                nearest = deadline
+        if nearest is None:
+            return Config.CACHE_CLEANUP_INTERVAL
+        return min(max(nearest - now, 0.05), Config.CACHE_CLEANUP_INTERVAL)
+
+    # 한 번의 락 점유에서 처리할 최대 만료 키 수
+    _CLEANUP_BATCH = 256
+
+    @staticmethod
+    def _evict_key(shard: _CacheShard, cache_name: str, key, only_expired: bool = True,
+                   now: float = None) -> int:
+        """해당 키 제거 (샤드 락을 쥔 상태에서 호출)
+
+        엔트리가 같은 키로 갱신됐을 수 있으므로 only_expired=True일 땐
+        삭제 전에 실제 만료 여부를 다시 확인한다. 용량 초과 축출 시에는
+        only_expired=False로 무조건 제거.
+        """
+        if cache_name == "stt":
+            entry = shard.stt.get(key)
+            if entry is not None and (not only_expired or entry.is_expired(now)):
+                del shard.stt[key]
+                shard.entry_count -= 1
+                return 1
+        elif cache_name == "translation":
+            entry = shard.translation.get(key)
+            if entry is not None and (not only_expired or entry.is_expired(now)):
+                del shard.translation[key]
+                shard.entry_count -= 1
+                return 1
+        else:  # tts
+            entry = shard.tts.get(key)
+            if entry is not None and (not only_expired or entry.is_expired(now)):
+                del shard.tts[key]
+                shard.entry_count -= 1
+                return 1
+        return 0
+
+    def _enforce_capacity(self, shard: _CacheShard):
+        """샤드 용량 초과 시 가장 오래된 엔트리부터 제거 (샤드 락 필요)
+
+        TTL이 모든 엔트리에 동일하므로 만료 힙의 순서가 삽입 순서(FIFO)와
+        일치한다 — 힙 head가 곧 가장 오래된 엔트리.
+        """
+        while shard.entry_count > self._MAX_ENTRIES_PER_SHARD and shard.expiry_heap:
+            _, cache_name, key = heapq.heappop(shard.expiry_heap)
+            self._evict_key(shard, cache_name, key, only_expired=False)
 
     def _cleanup_expired(self):
-        """만료된 캐시 엔트리 제거"""
-        with self._cache_lock:
-            cleaned = 0
-
-            # STT 캐시 정리
-            for room_id in list(self.stt_cache.keys()):
-                for speaker_id in list(self.stt_cache[room_id].keys()):
-                    for key in list(self.stt_cache[room_id][speaker_id].keys()):
-                        if self.stt_cache[room_id][speaker_id][key].is_expired():
-                            del self.stt_cache[room_id][speaker_id][key]
-                            cleaned += 1
-
-            # Translation 캐시 정리
-            for key in list(self.translation_cache.keys()):
-                if self.translation_cache[key].is_expired():
-                    del self.translation_cache[key]
-                    cleaned += 1
-
-            # TTS 캐시 정리
-            for key in list(self.tts_cache.keys()):
-                if self.tts_cache[key].is_expired():
-                    del self.tts_cache[key]
-                    cleaned += 1
-
-            if cleaned > 0:
-                DebugLogger.log("CACHE_CLEANUP", f"Cleaned {cleaned} expired entries")
+        """만료 힙에서 기한이 지난 키만 pop하여 제거 (샤드별 독립 수행)
+
+        하나의 긴 임계 구역 대신 배치(_CLEANUP_BATCH) 단위로 락을 놓았다
+        다시 잡아, 대량 만료 시에도 요청 경로의 p99 지연을 유지한다.
+        """
+        cleaned = 0
+        now = time.monotonic()
+
+        for shard in self._shards:
+            more = True
+            while more:
+                popped = 0
+                with shard.lock:
+                    heap = shard.expiry_heap
+                    while heap and heap[0][0] <= now and popped < self._CLEANUP_BATCH:
+                        _, cache_name, key = heapq.heappop(heap)
+                        popped += 1
+                        cleaned += self._evict_key(shard, cache_name, key, now=now)
+                    more = bool(heap and heap[0][0] <= now)
+
+        if cleaned > 0:
+            DebugLogger.log("CACHE_CLEANUP", f"Cleaned {cleaned} expired entries")
 
     def register_listener(self, room_id: str, listener_id: str, target_lang: str):
         """리스너 등록"""
-        with self._cache_lock:
-            self.room_listeners[room_id][target_lang].add(listener_id)
-            DebugLogger.log("CACHE", f"Listener registered", {
-                "room": room_id[:8] if room_id else "unknown",
-                "listener": listener_id[:8] if listener_id else "unknown",
-                "target_lang": target_lang,
-                "total_listeners": len(self.room_listeners[room_id][target_lang])
-            })
+        with self._listener_lock:
+            langs = self.room_listeners.setdefault(room_id, {})
+            updated = langs.get(target_lang, frozenset()) | {listener_id}
+            langs[target_lang] = updated
+        # 로깅(문자열 포맷/IO)은 락 해제 후 수행 (len(frozenset)은 O(1))
+        DebugLogger.log("CACHE", f"Listener registered", {
+            "room": room_id[:8] if room_id else "unknown",
+            "listener": listener_id[:8] if listener_id else "unknown",
+            "target_lang": target_lang,
+            "total_listeners": len(updated)
+        })
 
     def unregister_listener(self, room_id: str, listener_id: str, target_lang: str):
         """리스너 해제"""
-        with self._cache_lock:
-            if room_id in self.room_listeners and target_lang in self.room_listeners[room_id]:
-                self.room_listeners[room_id][target_lang].discard(listener_id)
+        with self._listener_lock:
+            langs = self.room_listeners.get(room_id)
+            if langs and target_lang in langs:
+                langs[target_lang] = langs[target_lang] - {listener_id}
 
     def get_listeners_for_language(self, room_id: str, target_lang: str) -> Set[str]:
-        """특정 타겟 언어의 모든 리스너 ID 반환"""
-        with self._cache_lock:
-            return self.room_listeners[room_id][target_lang].copy()
-
-    def _make_audio_hash(self, audio_bytes: bytes) -> str:
-        """오디오 데이터의 해시 생성 (빠른 비교용)"""
-        return hashlib.md5(audio_bytes).hexdigest()[:16]
+        """특정 타겟 언어의 모든 리스너 ID 반환 (불변 스냅샷 — 락/복사 없음)"""
+        langs = self.room_listeners.get(room_id)
+        if not langs:
+            return frozenset()
+        return langs.get(target_lang, frozenset())
+
+    @staticmethod
+    def _make_text_hash(text: str) -> int:
+        """번역/TTS 캐시 키용 텍스트 해시
+
+        STT 출력의 공백/대소문자 편차로 인한 캐시 미스를 줄이기 위해
+        정규화 후 해싱한다. 내장 hash()와 달리 프로세스 간에도 안정적.
+        """
+        text_norm = " ".join(text.split()).casefold()
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_intdigest(text_norm.encode())
+        return int.from_bytes(
+            hashlib.blake2b(text_norm.encode(), digest_size=8).digest(), "big"
+        )
+
+    def _make_audio_hash(self, audio_bytes: bytes) -> int:
+        """오디오 데이터의 해시 생성 (빠른 비교용)
+
+        보안이 아닌 중복 제거 용도이므로 비암호화 64-bit 해시 사용.
+        int 키를 그대로 사용하여 hexdigest/슬라이스 할당도 제거.
+        증분 해싱이 불가능한 호출자를 위한 하위 호환 래퍼.
+        """
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_intdigest(audio_bytes)
+        hasher = make_audio_hasher()
+        hasher.update(audio_bytes)
+        return hasher.intdigest()
 
     def get_or_create_stt(self, room_id: str, speaker_id: str, audio_bytes: bytes,
-                          transcribe_fn) -> Tuple[str, float, bool]:
+                          transcribe_fn, audio_hash: int = None) -> Tuple[str, float, bool]:
         """
         STT 결과 캐시에서 가져오거나 새로 생성
 
+        Args:
+            audio_hash: 증분 해셔(make_audio_hasher)로 미리 계산된 해시.
+                        None이면 audio_bytes 전체를 해싱.
+
         Returns:
             (text, confidence, was_cached)
         """
-        audio_hash = self._make_audio_hash(audio_bytes)
-        cache_key = f"{room_id}:{speaker_id}:{audio_hash}"
-
-        event = None
-        with self._cache_lock:
-            # 캐시 확인
-            if room_id in self.stt_cache and speaker_id in self.stt_cache[room_id]:
-                if audio_hash in self.stt_cache[room_id][speaker_id]:
-                    entry = self.stt_cache[room_id][speaker_id][audio_hash]
-                    if not entry.is_expired():
-                        DebugLogger.log("CACHE_HIT", "STT cache hit", {"key": cache_key[:16]})
-                        return entry.value[0], entry.value[1], True
-
-            # 처리 중인지 확인
-            if cache_key in self.pending_requests:
-                event = self.pending_requests[cache_key]
-
-        # 다른 스레드가 처리 중이면 대기
-        if event is not None:
-            event.wait(timeout=Config.STT_TIMEOUT)
-            with self._cache_lock:
-                if room_id in self.stt_cache and speaker_id in self.stt_cache[room_id]:
-                    if audio_hash in self.stt_cache[room_id][speaker_id]:
-                        entry = self.stt_cache[room_id][speaker_id][audio_hash]
-                        return entry.value[0], entry.value[1], True
-
-        # 처리 시작 마킹
-        with self._cache_lock:
-            self.pending_requests[cache_key] = threading.Event()
+        if audio_hash is None:
+            audio_hash = self._make_audio_hash(audio_bytes)
+        stt_key = (room_id, speaker_id, audio_hash)
+        shard = self._get_shard(stt_key)
+
+        now = time.monotonic()
+        with shard.lock:
+            # 캐시 확인 (평탄 키 — dict 조회 1회)
+            entry = shard.stt.get(stt_key)
+            if entry is not None and not entry.is_expired(now):
+                if DebugLogger.ENABLED:
+                    DebugLogger.log("CACHE_HIT", "STT cache hit", {"room": room_id[:8], "speaker": speaker_id[:8]})
+                return entry.value[0], entry.value[1], True
+
+            # single-flight: 처리 중이면 승자의 Future 공유, 아니면 내가 승자
+            future = shard.pending.get(stt_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                shard.pending[stt_key] = future
+
+        # 다른 스레드가 처리 중이면 결과 대기
+        # Event 방식과 달리 값을 Future에서 직접 받으므로 캐시 재조회가 없고,
+        # 생산자가 실패하면 예외가 전파되어 조용히 transcribe_fn을
+        # 중복 실행하는 일도 없다
+        if not is_owner:
+            text, confidence = future.result(timeout=Config.STT_TIMEOUT)
+            return text, confidence, True
 
         try:
             # 실제 STT 처리
             text, confidence = transcribe_fn(audio_bytes)
 
-            # 결과 캐시
-            with self._cache_lock:
-                self.stt_cache[room_id][speaker_id][audio_hash] = CacheEntry(
-                    value=(text, confidence),
-                    created_at=time.time()
-                )
-                DebugLogger.log("CACHE_SET", "STT cached", {"key": cache_key[:16], "text_len": len(text)})
-
+            # 결과 캐시 (엔트리 생성/로깅은 락 밖에서, 락 안에서는 대입만)
+            new_entry = CacheEntry(value=(text, confidence), created_at=time.monotonic())
+            with shard.lock:
+                if stt_key not in shard.stt:
+                    shard.entry_count += 1
+                shard.stt[stt_key] = new_entry
+                heapq.heappush(shard.expiry_heap,
+                               (new_entry.created_at + new_entry.ttl, "stt", stt_key))
+                self._enforce_capacity(shard)
+            if DebugLogger.ENABLED:
+                DebugLogger.log("CACHE_SET", "STT cached", {"room": room_id[:8], "text_len": len(text)})
+
+            future.set_result((text, confidence))
             return text, confidence, False
+        except BaseException as e:
+            future.set_exception(e)
+            raise
         finally:
-            with self._cache_lock:
-                if cache_key in self.pending_requests:
-                    self.pending_requests[cache_key].set()
-                    del self.pending_requests[cache_key]
+            with shard.lock:
+                shard.pending.pop(stt_key, None)
 
     def get_or_create_translation(self, room_id: str, text: str, source_lang: str, target_lang: str,
                                    translate_fn) -> Tuple[str, bool]:
@@ -196,27 +436,59 @@ class RoomCacheManager:
         Returns:
             (translated_text, was_cached)
         """
-        cache_key = f"{room_id}:{source_lang}:{target_lang}:{hash(text)}"
-
-        with self._cache_lock:
-            if cache_key in self.translation_cache:
-                entry = self.translation_cache[cache_key]
-                if not entry.is_expired():
-                    DebugLogger.log("CACHE_HIT", "Translation cache hit", {"room": room_id[:8], "key": cache_key[:24]})
-                    return entry.value, True
-
-        # 실제 번역 처리
-        translated = translate_fn(text, source_lang, target_lang)
-
-        # 결과 캐시
-        with self._cache_lock:
-            self.translation_cache[cache_key] = CacheEntry(
-                value=translated,
-                created_at=time.time()
-            )
-            DebugLogger.log("CACHE_SET", "Translation cached", {"room": room_id[:8], "key": cache_key[:24]})
+        # 튜플 키: f-string 조립/추가 해싱 없이 dict가 원소 해시를 병합
+        cache_key = (room_id, source_lang, target_lang, self._make_text_hash(text))
+        shard = self._get_shard(cache_key)
+
+        # 읽기는 락 없이 수행 (CPython dict.get은 GIL 하에서 원자적)
+        now = time.monotonic()
+        entry = shard.translation.get(cache_key)
+        if entry is not None and not entry.is_expired(now):
+            if DebugLogger.ENABLED:
+                DebugLogger.log("CACHE_HIT", "Translation cache hit", {"room": room_id[:8], "langs": f"{source_lang}->{target_lang}"})
+            return entry.value, True
+
+        with shard.lock:
+            # double-check: 락 획득 사이에 다른 스레드가 채웠을 수 있음
+            entry = shard.translation.get(cache_key)
+            if entry is not None and not entry.is_expired(now):
+                return entry.value, True
+
+            future = shard.pending.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                shard.pending[cache_key] = future
+
+        # 동일 키가 처리 중이면 N번의 AWS Translate 호출 대신 결과 공유
+        if not is_owner:
+            translated = future.result(timeout=Config.TRANSLATION_TIMEOUT)
+            return translated, True
 
-        return translated, False
+        try:
+            # 실제 번역 처리
+            translated = translate_fn(text, source_lang, target_lang)
+
+            # 결과 캐시 (엔트리 생성/로깅은 락 밖에서, 락 안에서는 대입만)
+            new_entry = CacheEntry(value=translated, created_at=time.monotonic())
+            with shard.lock:
+                if cache_key not in shard.translation:
+                    shard.entry_count += 1
+                shard.translation[cache_key] = new_entry
+                heapq.heappush(shard.expiry_heap,
+                               (new_entry.created_at + new_entry.ttl, "translation", cache_key))
+                self._enforce_capacity(shard)
+            if DebugLogger.ENABLED:
+                DebugLogger.log("CACHE_SET", "Translation cached", {"room": room_id[:8], "langs": f"{source_lang}->{target_lang}"})
+
+            future.set_result(translated)
+            return translated, False
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with shard.lock:
+                shard.pending.pop(cache_key, None)
 
     def get_or_create_tts(self, room_id: str, text: str, target_lang: str,
                           synthesize_fn) -> Tuple[bytes, int, bool]:
@@ -226,24 +498,56 @@ class RoomCacheManager:
         Returns:
             (audio_bytes, duration_ms, was_cached)
         """
-        cache_key = f"{room_id}:tts:{target_lang}:{hash(text)}"
-
-        with self._cache_lock:
-            if cache_key in self.tts_cache:
-                entry = self.tts_cache[cache_key]
-                if not entry.is_expired():
-                    DebugLogger.log("CACHE_HIT", "TTS cache hit", {"room": room_id[:8], "key": cache_key[:24]})
-                    return entry.value[0], entry.value[1], True
-
-        # 실제 TTS 처리
-        audio_bytes, duration_ms = synthesize_fn(text, target_lang)
-
-        # 결과 캐시
-        with self._cache_lock:
-            self.tts_cache[cache_key] = CacheEntry(
-                value=(audio_bytes, duration_ms),
-                created_at=time.time()
-            )
-            DebugLogger.log("CACHE_SET", "TTS cached", {"room": room_id[:8], "key": cache_key[:24]})
-
-        return audio_bytes, duration_ms, False
+        # 튜플 키 ("tts" 마커로 번역 키와 구분 — pending 맵을 공유하므로)
+        cache_key = (room_id, "tts", target_lang, self._make_text_hash(text))
+        shard = self._get_shard(cache_key)
+
+        # 읽기는 락 없이 수행 (CPython dict.get은 GIL 하에서 원자적)
+        now = time.monotonic()
+        entry = shard.tts.get(cache_key)
+        if entry is not None and not entry.is_expired(now):
+            if DebugLogger.ENABLED:
+                DebugLogger.log("CACHE_HIT", "TTS cache hit", {"room": room_id[:8], "lang": target_lang})
+            return entry.value[0], entry.value[1], True
+
+        with shard.lock:
+            # double-check: 락 획득 사이에 다른 스레드가 채웠을 수 있음
+            entry = shard.tts.get(cache_key)
+            if entry is not None and not entry.is_expired(now):
+                return entry.value[0], entry.value[1], True
+
+            future = shard.pending.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                shard.pending[cache_key] = future
+
+        # 동일 키가 처리 중이면 N번의 Polly 호출 대신 결과 공유
+        if not is_owner:
+            audio_bytes, duration_ms = future.result(timeout=Config.TTS_TIMEOUT)
+            return audio_bytes, duration_ms, True
+
+        try:
+            # 실제 TTS 처리
+            audio_bytes, duration_ms = synthesize_fn(text, target_lang)
+
+            # 결과 캐시 (엔트리 생성/로깅은 락 밖에서, 락 안에서는 대입만)
+            new_entry = CacheEntry(value=(audio_bytes, duration_ms), created_at=time.monotonic())
+            with shard.lock:
+                if cache_key not in shard.tts:
+                    shard.entry_count += 1
+                shard.tts[cache_key] = new_entry
+                heapq.heappush(shard.expiry_heap,
+                               (new_entry.created_at + new_entry.ttl, "tts", cache_key))
+                self._enforce_capacity(shard)
+            if DebugLogger.ENABLED:
+                DebugLogger.log("CACHE_SET", "TTS cached", {"room": room_id[:8], "lang": target_lang})
+
+            future.set_result((audio_bytes, duration_ms))
+            return audio_bytes, duration_ms, False
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with shard.lock:
+                shard.pending.pop(cache_key, None)
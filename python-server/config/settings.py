@@ -21,6 +21,11 @@ class Config:
     SENTENCE_MAX_DURATION_MS = 2500  # 문장 최대 대기 시간 (2.5초)
     SENTENCE_MAX_BYTES = int(BYTES_PER_SECOND * SENTENCE_MAX_DURATION_MS / 1000)
 
+    # 부분(미확정) transcript 방출 간격 - buffer_full까지 기다리지 않고
+    # 이 간격마다 누적 버퍼를 전사해 is_partial=True로 먼저 내보냄 (0이면 비활성)
+    PARTIAL_STT_INTERVAL_MS = int(os.getenv("PARTIAL_STT_INTERVAL_MS", "800"))
+    PARTIAL_STT_INTERVAL_BYTES = int(BYTES_PER_SECOND * PARTIAL_STT_INTERVAL_MS / 1000)
+
     # VAD settings
     SILENCE_THRESHOLD_RMS = 30
     SILENCE_DURATION_MS = 350  # 문장 끝 감지용 침묵 지속 시간
@@ -76,6 +81,11 @@ class Config:
     WHISPER_BEAM_SIZE = 1
     WHISPER_BEST_OF = 1
     WHISPER_TEMPERATURE = 0.0
+    WHISPER_BATCH_SIZE = 8  # BatchedInferencePipeline encoder 배치 크기
+
+    # 업스트림 VADProcessor가 이미 음성 프레임만 버퍼링하므로
+    # Whisper 내부 Silero VAD 재실행을 기본 생략 (이중 VAD 제거)
+    WHISPER_SKIP_VAD = os.getenv("WHISPER_SKIP_VAD", "1") == "1"
 
     # Language code mappings for Whisper
     WHISPER_LANG_CODES = {
@@ -122,6 +132,16 @@ class Config:
     # Qwen3 Translation Model (Alibaba)
     QWEN_MODEL = os.getenv("QWEN_MODEL", "Qwen/Qwen3-8B")
 
+    # Qwen 번역 마이크로 배치 (동시 요청을 윈도우 동안 모아 generate 1회로)
+    QWEN_BATCH_WINDOW_MS = 30
+    QWEN_MAX_BATCH = 8
+
+    # torch.compile(reduce-overhead) 적용 여부 (문제 시 환경변수로 끌 수 있게)
+    COMPILE_QWEN = os.getenv("COMPILE_QWEN", "1") == "1"
+
+    # VRAM이 충분해도 NF4 4-bit 로드 강제 (decode는 memory-bound라 토큰 지연도 단축)
+    QWEN_FORCE_4BIT = os.getenv("QWEN_FORCE_4BIT", "0") == "1"
+
     # GPU Device
     GPU_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
 
@@ -143,6 +163,10 @@ class Config:
 
     # AWS Polly
     AWS_REGION = os.getenv("AWS_REGION", "ap-northeast-2")
+    # "mp3" (클라이언트 호환) 또는 "pcm" (디코드 불필요 + 정확한 duration)
+    TTS_OUTPUT_FORMAT = os.getenv("TTS_OUTPUT_FORMAT", "mp3")
+    # 실제 합성 출력 샘플레이트 - Polly 호출과 AudioResult가 같은 값을 쓴다
+    TTS_SAMPLE_RATE = 16000 if TTS_OUTPUT_FORMAT == "pcm" else 24000
 
     # gRPC
     GRPC_PORT = int(os.getenv("GRPC_PORT", 50051))
@@ -185,13 +209,25 @@ class Config:
     # Minimum audio duration to process (seconds)
     MIN_AUDIO_DURATION = 0.3  # 300ms minimum
 
+    # N회 전사마다 torch.cuda.empty_cache() (장기 구동 시 VRAM 누적 완화)
+    STT_CACHE_RELEASE_EVERY = 100
+
     # ==========================================================================
     # Room Cache Settings
     # ==========================================================================
     CACHE_TTL_SECONDS = 10  # 캐시 유효 시간 (10초)
     CACHE_CLEANUP_INTERVAL = 30  # 캐시 정리 간격 (30초)
+    CACHE_MAX_ENTRIES = 10_000  # 트래픽 급증 시 메모리 상한 (전체 엔트리 수)
+
+    # RoomProcessor 보관 상한 (비정상 종료로 remove가 누락돼도 LRU로 회수)
+    MAX_ROOMS = int(os.getenv("MAX_ROOMS", "500"))
 
     # ==========================================================================
     # Parallel Processing Settings
     # ==========================================================================
     PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", "8"))  # 병렬 처리 worker 수
+
+    # 스테이지별 executor worker 수 (번역: 모델/CPU 바운드, TTS: 네트워크 I/O 바운드)
+    # 큰 호스트에서도 공유 모델 리소스 경합을 피하도록 16으로 상한
+    TRANS_WORKERS = int(os.getenv("TRANS_WORKERS", str(min(os.cpu_count() or 4, 16))))
+    TTS_WORKERS = int(os.getenv("TTS_WORKERS", str(min((os.cpu_count() or 4) * 2, 16))))
@@ -5,6 +5,12 @@ Async Loop Manager for handling asyncio in threaded gRPC context
 import asyncio
 import threading
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 class AsyncLoopManager:
     """
@@ -27,7 +33,11 @@ class AsyncLoopManager:
         if self._initialized:
             return
 
-        self.loop = asyncio.new_event_loop()
+        # uvloop: C 레벨 스케줄러로 task dispatch가 2-4배 빠름 (미설치 시 기본 루프)
+        if UVLOOP_AVAILABLE:
+            self.loop = uvloop.new_event_loop()
+        else:
+            self.loop = asyncio.new_event_loop()
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
         self._initialized = True
@@ -36,6 +46,17 @@ class AsyncLoopManager:
         asyncio.set_event_loop(self.loop)
         self.loop.run_forever()
 
+    def submit(self, coro):
+        """
+        코루틴을 루프에 제출하고 즉시 Future 반환 (호출 스레드 비블로킹)
+
+        결과가 필요 없거나 나중에 받아도 되는 호출자용.
+
+        Returns:
+            concurrent.futures.Future
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
     def run_async(self, coro, timeout: float = 30.0):
         """
         비동기 코루틴을 실행하고 결과를 반환
@@ -47,7 +68,7 @@ class AsyncLoopManager:
         Returns:
             코루틴 결과
         """
-        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        future = self.submit(coro)
         try:
             return future.result(timeout=timeout)
         except asyncio.TimeoutError:
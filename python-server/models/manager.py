@@ -7,17 +7,19 @@ import os
 import time
 import threading
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy as np
 import torch
 import boto3
+from botocore.config import Config as BotoConfig
 
 from config.settings import Config
 from utils.logger import DebugLogger
 from cache.room_cache import RoomCacheManager
 from models.async_manager import AsyncLoopManager
 from models.stt import STTMixin
-from models.translation import TranslationMixin
+from models.translation import TranslationMixin, QwenTranslationBatcher
 from models.tts import TTSMixin
 
 # Optional imports
@@ -28,6 +30,13 @@ except ImportError:
     FASTER_WHISPER_AVAILABLE = False
     print("[INFO] faster-whisper not installed.")
 
+try:
+    # 구버전 faster-whisper에는 없음 - 있으면 encoder 배치 처리로 처리량 향상
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_PIPELINE_AVAILABLE = True
+except ImportError:
+    BATCHED_PIPELINE_AVAILABLE = False
+
 try:
     import nemo.collections.asr as nemo_asr
     import soundfile as sf
@@ -82,6 +91,8 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
         print("      ✓ Async Loop Manager & Room Cache initialized")
 
         # 1. STT Backend - Multi-Model or Single Model
+        self._cuda_warmed = False
+        self._warm_cuda_context()
         self.whisper_model = None  # Legacy single model
         self.whisper_models = {}   # Language-specific Whisper models
         self.nemo_models = {}      # Language-specific NeMo models
@@ -94,11 +105,7 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
             print(f"[1/4] Loading faster-whisper ({Config.WHISPER_MODEL_SIZE})...")
             print(f"      Device: {Config.WHISPER_DEVICE}, Compute: {Config.WHISPER_COMPUTE_TYPE}")
 
-            self.whisper_model = WhisperModel(
-                Config.WHISPER_MODEL_SIZE,
-                device=Config.WHISPER_DEVICE,
-                compute_type=Config.WHISPER_COMPUTE_TYPE,
-            )
+            self.whisper_model = self._build_whisper_model(Config.WHISPER_MODEL_SIZE)
             print("      ✓ faster-whisper loaded")
 
         elif Config.STT_BACKEND == "transcribe" and AMAZON_TRANSCRIBE_AVAILABLE:
@@ -116,15 +123,25 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
         # 2. Qwen3 Translation Model
         print(f"[2/4] Loading Qwen3 {Config.QWEN_MODEL}...")
         self._load_qwen_model()
+        self.qwen_batcher = QwenTranslationBatcher(self._translate_qwen_batch)
+
+        # boto3 커넥션 풀/재시도: 버스트 시 커넥션 고갈로 직렬화되지 않도록
+        boto_config = BotoConfig(
+            max_pool_connections=Config.MAX_WORKERS,
+            retries={"max_attempts": 2, "mode": "adaptive"},
+            tcp_keepalive=True,  # 유휴 후 재연결 TLS handshake 방지
+            connect_timeout=2,  # 기본 60초 - 실시간 파이프라인에는 빠른 실패가 낫다
+            read_timeout=Config.TRANSLATION_TIMEOUT,
+        )
 
         # 3. Amazon Polly TTS
         print("[3/4] Initializing Amazon Polly...")
-        self.polly_client = boto3.client("polly", region_name=Config.AWS_REGION)
+        self.polly_client = boto3.client("polly", region_name=Config.AWS_REGION, config=boto_config)
         print("      ✓ Polly initialized")
 
         # 4. AWS Translate
         print("[4/4] Initializing AWS Translate...")
-        self.translate_client = boto3.client("translate", region_name=Config.AWS_REGION)
+        self.translate_client = boto3.client("translate", region_name=Config.AWS_REGION, config=boto_config)
         print(f"      ✓ AWS Translate initialized (backend: {Config.TRANSLATION_BACKEND})")
 
         print("=" * 70)
@@ -136,76 +153,121 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
         self._initialized = True
         self._warmup()
 
+    def _warm_cuda_context(self):
+        """
+        CT2/NeMo 로드 전에 CUDA 컨텍스트를 미리 생성
+        첫 CUDA 호출의 lazy-init 지연이 모델 로드 시간에 섞이지 않도록 함
+        """
+        if self._cuda_warmed or Config.WHISPER_DEVICE != "cuda":
+            return
+        torch.cuda.init()
+        (torch.zeros(1, device="cuda") + 1).item()
+        self._cuda_warmed = True
+
+    def _build_whisper_model(self, model_name: str, compute_type: str = None):
+        """
+        WhisperModel 생성 헬퍼
+        BatchedInferencePipeline 지원 시 래핑하여 encoder 배치 처리 활성화
+        (동시 발화 시 세그먼트들이 padded batch로 묶여 GPU 활용도 향상)
+        """
+        model = WhisperModel(
+            model_name,
+            device=Config.WHISPER_DEVICE,
+            compute_type=compute_type or Config.WHISPER_COMPUTE_TYPE,
+        )
+        if BATCHED_PIPELINE_AVAILABLE:
+            model = BatchedInferencePipeline(model=model)
+        return model
+
+    def _load_stt_checkpoint(self, model_type: str, model_name: str,
+                             compute_type: str, cuda_lock: threading.Lock):
+        """단일 STT 체크포인트 로드 (병렬 로더의 worker)"""
+        if model_type == "whisper" and FASTER_WHISPER_AVAILABLE:
+            return self._build_whisper_model(model_name, compute_type)
+
+        if model_type == "nemo" and NEMO_AVAILABLE:
+            model = nemo_asr.models.ASRModel.from_pretrained(model_name)
+            if Config.WHISPER_DEVICE == "cuda":
+                # 디바이스 이동은 컨텍스트 경합을 피하기 위해 직렬화
+                with cuda_lock:
+                    model = model.cuda()
+            model.eval()
+            return model
+
+        return None
+
     def _load_multi_model_stt(self):
-        """Load language-specific STT models (with deduplication)"""
+        """Load language-specific STT models (parallel + deduplicated)"""
         print("[1/4] Loading Multi-Model STT (Language-Specific)...")
         print(f"      Device: {Config.WHISPER_DEVICE}, Compute: {Config.WHISPER_COMPUTE_TYPE}")
         print()
 
-        # Track loaded models to avoid duplicate loading
+        # 고유 (type, model) 조합만 추출 - 로드는 디스크 I/O + cudaMemcpy가 지배적이고
+        # CT2/NeMo 모두 그 구간에서 GIL을 놓으므로 스레드 병렬화로 ΣT_i → max(T_i)
+        unique_models = set()
+        for model_config in Config.MULTI_MODEL_STT.values():
+            unique_models.add((
+                model_config["type"],
+                model_config["model"],
+                model_config.get("compute_type"),  # 모델별 quantization override
+            ))
+        unique_models.add((
+            Config.FALLBACK_MODEL["type"],
+            Config.FALLBACK_MODEL["model"],
+            Config.FALLBACK_MODEL.get("compute_type"),
+        ))
+
+        cuda_lock = threading.Lock()
+        results = {}  # (type, model_name) -> model instance or None
+
+        with ThreadPoolExecutor(max_workers=min(4, len(unique_models))) as executor:
+            futures = {
+                executor.submit(self._load_stt_checkpoint, mtype, mname, ctype, cuda_lock): (mtype, mname)
+                for mtype, mname, ctype in unique_models
+            }
+            for future in as_completed(futures):
+                mtype, mname = futures[future]
+                try:
+                    model = future.result()
+                    results[(mtype, mname)] = model
+                    if model is not None:
+                        print(f"      ✓ Loaded {mname} ({mtype})")
+                    else:
+                        print(f"      ⚠ Skipped {mname} (framework not available)")
+                except Exception as e:
+                    results[(mtype, mname)] = None
+                    print(f"      ✗ Failed to load {mname}: {e}")
+
+        # 언어 → 모델 매핑은 메인 스레드에서 구성
         loaded_whisper_models = {}  # model_name -> WhisperModel instance
         loaded_nemo_models = {}     # model_name -> NeMo model instance
 
         for lang, model_config in Config.MULTI_MODEL_STT.items():
             model_type = model_config["type"]
             model_name = model_config["model"]
-            description = model_config["description"]
-
-            print(f"      [{lang.upper()}] {description}")
-            print(f"           Model: {model_name}")
-
-            try:
-                if model_type == "whisper" and FASTER_WHISPER_AVAILABLE:
-                    # Check if model already loaded
-                    if model_name in loaded_whisper_models:
-                        self.whisper_models[lang] = loaded_whisper_models[model_name]
-                        print(f"           ✓ Reusing already loaded model")
-                    else:
-                        model = WhisperModel(
-                            model_name,
-                            device=Config.WHISPER_DEVICE,
-                            compute_type=Config.WHISPER_COMPUTE_TYPE,
-                        )
-                        loaded_whisper_models[model_name] = model
-                        self.whisper_models[lang] = model
-                        print(f"           ✓ Loaded (faster-whisper)")
-
-                elif model_type == "nemo" and NEMO_AVAILABLE:
-                    # Check if model already loaded
-                    if model_name in loaded_nemo_models:
-                        self.nemo_models[lang] = loaded_nemo_models[model_name]
-                        print(f"           ✓ Reusing already loaded model")
-                    else:
-                        model = nemo_asr.models.ASRModel.from_pretrained(model_name)
-                        if Config.WHISPER_DEVICE == "cuda":
-                            model = model.cuda()
-                        model.eval()
-                        loaded_nemo_models[model_name] = model
-                        self.nemo_models[lang] = model
-                        print(f"           ✓ Loaded (NeMo)")
-
-                else:
-                    print(f"           ⚠ Skipped (framework not available)")
-
-            except Exception as e:
-                print(f"           ✗ Failed to load: {e}")
-
-        # Load fallback model (also check for deduplication)
-        fallback_name = Config.FALLBACK_MODEL["model"]
-        print(f"\n      [FALLBACK] Loading {Config.FALLBACK_MODEL['description']}...")
-        try:
-            if fallback_name in loaded_whisper_models:
-                self.whisper_models["fallback"] = loaded_whisper_models[fallback_name]
-                print(f"           ✓ Reusing already loaded model")
+            model = results.get((model_type, model_name))
+
+            print(f"      [{lang.upper()}] {model_config['description']}")
+            if model is None:
+                print(f"           ⚠ Unavailable")
+            elif model_type == "whisper":
+                self.whisper_models[lang] = model
+                loaded_whisper_models[model_name] = model
+                print(f"           ✓ Mapped (faster-whisper)")
             else:
-                self.whisper_models["fallback"] = WhisperModel(
-                    fallback_name,
-                    device=Config.WHISPER_DEVICE,
-                    compute_type=Config.WHISPER_COMPUTE_TYPE,
-                )
-                print(f"           ✓ Loaded")
-        except Exception as e:
-            print(f"           ✗ Failed: {e}")
+                self.nemo_models[lang] = model
+                loaded_nemo_models[model_name] = model
+                print(f"           ✓ Mapped (NeMo)")
+
+        fallback = Config.FALLBACK_MODEL
+        fallback_model = results.get((fallback["type"], fallback["model"]))
+        print(f"\n      [FALLBACK] {fallback['description']}")
+        if fallback_model is not None and fallback["type"] == "whisper":
+            self.whisper_models["fallback"] = fallback_model
+            loaded_whisper_models[fallback["model"]] = fallback_model
+            print(f"           ✓ Mapped")
+        else:
+            print(f"           ✗ Unavailable")
 
         print()
         unique_whisper = len(loaded_whisper_models)
@@ -214,6 +276,12 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
         print(f"      Summary: {unique_whisper} unique Whisper, {unique_nemo} unique NeMo models")
         print(f"               {total_mappings} language mappings created")
 
+        # VRAM 예산 확인 (모델 추가/양자화 변경 시 OOM 여부를 부팅 로그에서 바로 확인)
+        if Config.WHISPER_DEVICE == "cuda":
+            free_b, total_b = torch.cuda.mem_get_info()
+            print(f"      VRAM after STT load: {(total_b - free_b) / 1024**3:.1f}GB used"
+                  f" / {total_b / 1024**3:.1f}GB total")
+
     def _load_qwen_model(self):
         """Load Qwen3 translation model"""
         self.qwen_tokenizer = AutoTokenizer.from_pretrained(
@@ -225,12 +293,13 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
             gpu_mem = torch.cuda.get_device_properties(0).total_memory / (1024**3)
             print(f"      GPU Memory: {gpu_mem:.1f}GB")
 
-            if gpu_mem >= 20:
+            if gpu_mem >= 20 and not Config.QWEN_FORCE_4BIT:
                 self.qwen_model = AutoModelForCausalLM.from_pretrained(
                     Config.QWEN_MODEL,
                     torch_dtype=torch.float16,
                     device_map={"": 0},
                     trust_remote_code=True,
+                    low_cpu_mem_usage=True,  # meta-device + mmap 로드 (RAM 피크/로드 시간 절감)
                 )
             else:
                 from transformers import BitsAndBytesConfig
@@ -252,11 +321,70 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
                 Config.QWEN_MODEL,
                 torch_dtype=torch.float32,
                 trust_remote_code=True,
+                low_cpu_mem_usage=True,
             )
 
         self.qwen_model.eval()
+        self._compile_qwen()
         print("      ✓ Qwen3-8B loaded")
 
+    def _compile_qwen(self):
+        """
+        Qwen forward를 torch.compile(reduce-overhead)로 특화
+        Inductor 컴파일 아티팩트를 디스크에 보존해 다음 부팅에서 재사용
+        """
+        self._compile_cache_path = None
+
+        if not Config.COMPILE_QWEN or Config.GPU_DEVICE != "cuda" or not hasattr(torch, "compile"):
+            return
+
+        try:
+            import hashlib
+            cache_key = hashlib.sha256(
+                f"{Config.QWEN_MODEL}-{torch.__version__}".encode()
+            ).hexdigest()[:16]
+            self._compile_cache_path = os.path.join(
+                tempfile.gettempdir(), f"qwen_compile_{cache_key}.bin"
+            )
+
+            # 이전 부팅의 컴파일 아티팩트 재사용 (~90초 warmup 컴파일 회피)
+            if (hasattr(torch.compiler, "load_cache_artifacts")
+                    and os.path.exists(self._compile_cache_path)):
+                try:
+                    with open(self._compile_cache_path, "rb") as f:
+                        torch.compiler.load_cache_artifacts(f.read())
+                    print("      ✓ Reusing torch.compile cache artifacts")
+                except Exception as e:
+                    print(f"      ⚠ Compile cache load failed: {e}")
+
+            # seqlen별 재컴파일이 캐시를 밀어내지 않도록 여유 확보
+            torch._dynamo.config.cache_size_limit = 64
+
+            self.qwen_model.forward = torch.compile(
+                self.qwen_model.forward,
+                mode="reduce-overhead",
+                dynamic=False,
+                fullgraph=False,
+            )
+            print("      ✓ Qwen forward compiled (reduce-overhead)")
+
+        except Exception as e:
+            print(f"      ⚠ torch.compile skipped: {e}")
+
+    def _save_compile_cache(self):
+        """warmup에서 실제 decode를 돌린 뒤 컴파일 아티팩트를 저장"""
+        path = getattr(self, "_compile_cache_path", None)
+        if path is None or not hasattr(torch.compiler, "save_cache_artifacts"):
+            return
+        try:
+            artifacts = torch.compiler.save_cache_artifacts()
+            if artifacts:
+                with open(path, "wb") as f:
+                    f.write(artifacts[0])
+                print(f"         ✓ Compile cache saved ({path})")
+        except Exception as e:
+            print(f"         ⚠ Compile cache save failed: {e}")
+
     def _warmup(self):
         """Warmup all loaded models"""
         print("\n" + "=" * 70)
@@ -264,7 +392,12 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
         print("=" * 70)
 
         warmup_start = time.time()
-        dummy_audio = np.zeros(16000, dtype=np.float32)
+        # 전부 0이면 VAD가 바로 끊어 encoder가 돌지 않음 → 저레벨 노이즈 30초로
+        # 실트래픽과 같은 코드 경로/shape를 태움
+        rng = np.random.default_rng(0)
+        dummy_audio = (rng.standard_normal(Config.SAMPLE_RATE * 30) * 0.01).astype(np.float32)
+        # 번역 warmup도 실제 발화 길이(~32 토큰)로 specialize
+        warmup_text = " ".join(["테스트"] * 32)
 
         # 1. Multi-Model warmup (deduplicated - only warmup unique models)
         if Config.STT_BACKEND == "multi":
@@ -283,7 +416,7 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
                     segments, info = model.transcribe(
                         dummy_audio,
                         language=Config.WHISPER_LANG_CODES.get(lang, "en"),
-                        beam_size=1,
+                        beam_size=Config.WHISPER_BEAM_SIZE,
                         vad_filter=False,
                     )
                     list(segments)
@@ -302,12 +435,8 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
 
                 try:
                     print(f"         [{lang.upper()}] Warming up NeMo...")
-                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                        temp_path = f.name
-                        audio_int16 = np.zeros(16000, dtype=np.int16)
-                        sf.write(temp_path, audio_int16, Config.SAMPLE_RATE)
-                    model.transcribe([temp_path])
-                    os.unlink(temp_path)
+                    # 실제 요청과 동일한 in-memory 경로로 warmup
+                    self._transcribe_nemo(dummy_audio, model, lang)
                     warmed_nemo.add(model_id)
                     print(f"         [{lang.upper()}] ✓ NeMo warmup complete")
                 except Exception as e:
@@ -319,7 +448,7 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
                 segments, info = self.whisper_model.transcribe(
                     dummy_audio,
                     language="en",
-                    beam_size=1,
+                    beam_size=Config.WHISPER_BEAM_SIZE,
                     vad_filter=False,
                 )
                 list(segments)
@@ -331,10 +460,17 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
         if Config.TRANSLATION_BACKEND == "aws":
             print("[Warmup] AWS Translate...")
             try:
-                _ = self._translate_aws("안녕하세요", "ko", "en")
+                _ = self._translate_aws(warmup_text, "ko", "en")
                 print("         ✓ AWS Translate warmup complete")
             except Exception as e:
                 print(f"         ⚠ AWS Translate warmup failed: {e}")
+        elif Config.TRANSLATION_BACKEND == "qwen":
+            print("[Warmup] Qwen3 Translation...")
+            try:
+                _ = self._translate_qwen(warmup_text, "ko", "en")
+                print("         ✓ Qwen warmup complete")
+            except Exception as e:
+                print(f"         ⚠ Qwen warmup failed: {e}")
 
         # 3. TTS warmup
         print("[Warmup] Amazon Polly...")
@@ -344,6 +480,9 @@ class ModelManager(STTMixin, TranslationMixin, TTSMixin):
         except Exception as e:
             print(f"         ⚠ TTS warmup failed: {e}")
 
+        # 4. Compile cache 저장 (warmup decode가 컴파일을 채운 뒤)
+        self._save_compile_cache()
+
         warmup_time = time.time() - warmup_start
         print("=" * 70)
         print(f"Warmup completed in {warmup_time:.2f}s")
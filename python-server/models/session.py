@@ -3,11 +3,17 @@ Participant & Session Management
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
+from uuid import uuid4
 
-from audio import VADProcessor
+from audio import VADProcessor, acquire_vad, release_vad
+from cache import make_audio_hasher
+from config import Config
 from language import BufferingStrategy, LanguageTopology
 
+# 세션 오디오 버퍼 사전 할당 용량 (30초 발화, flush 상한보다 충분히 여유)
+_AUDIO_BUFFER_CAP = Config.BYTES_PER_SECOND * 30
+
 
 @dataclass
 class Participant:
@@ -36,12 +42,18 @@ class SessionState:
     speaker: Speaker
     participants: Dict[str, Participant] = field(default_factory=dict)
 
-    # 오디오 버퍼
-    audio_buffer: bytearray = field(default_factory=bytearray)
+    # 오디오 버퍼: 고정 용량 사전 할당 + write 위치 (extend의 realloc/memcpy 제거)
+    # 해셔는 버퍼와 함께 증분 갱신
+    audio_buffer: bytearray = field(default_factory=lambda: bytearray(_AUDIO_BUFFER_CAP))
+    audio_len: int = 0
+    audio_hasher: object = field(default_factory=make_audio_hasher)
     text_buffer: str = ""
 
-    # VAD
-    vad: VADProcessor = field(default_factory=VADProcessor)
+    # VAD (풀에서 대여, 세션 종료 시 release_vad()로 반납)
+    vad: VADProcessor = field(default_factory=acquire_vad)
+
+    # 타겟 언어 → 번역 활성 참가자 ID 집합 (참가자 변경 시에만 재구성되는 인덱스)
+    target_lang_index: Dict[str, Set[str]] = field(default_factory=dict)
 
     # 현재 버퍼링 전략 (타겟 언어에 따라 다를 수 있음)
     primary_strategy: BufferingStrategy = BufferingStrategy.CHUNK_BASED
@@ -56,33 +68,107 @@ class SessionState:
     total_translation_latency_ms: float = 0
     total_tts_latency_ms: float = 0
 
-    def get_target_languages(self) -> Set[str]:
-        """번역이 활성화된 참가자들의 타겟 언어 목록"""
-        languages = set()
+    def __post_init__(self):
+        # 서비스 레이어가 채우는 표시용 proto 캐시 (스피커 변경 시 무효화)
+        self._speaker_proto = None
+        # 현재 이 세션을 소유한 스트림의 표식 (재연결 시 새 스트림이 교체)
+        # 구 스트림의 정리 경로가 인계된 세션의 VAD를 반납하지 못하게 막는다
+        self._stream_token = None
+        # transcript 상관용 세션 내 단조 카운터 (transcript마다의 uuid4 대체)
+        # 접두사는 세션당 1회 난수 논스 - session_id 접두사는 room-hub 경로에서
+        # 전부 "room"이라 세션 간 ID가 결정적으로 충돌한다
+        self._next_transcript_id = 0
+        self._transcript_prefix = uuid4().hex[:4]
+        self.rebuild_language_index()
+
+    def next_transcript_id(self) -> str:
+        """세션 논스 접두사 + 16진 카운터로 8자 transcript ID 생성"""
+        self._next_transcript_id += 1
+        return f"{self._transcript_prefix}{self._next_transcript_id:04x}"
+
+    def rebuild_language_index(self):
+        """참가자 목록에서 타겟 언어 인덱스 재구성 (join/leave/설정 변경 시 호출)"""
+        index: Dict[str, Set[str]] = {}
         for p in self.participants.values():
-            if p.translation_enabled and p.target_language != self.speaker.source_language:
-                languages.add(p.target_language)
-        return languages
+            if p.translation_enabled:
+                index.setdefault(p.target_language, set()).add(p.participant_id)
+        self.target_lang_index = index
+        # 조회 경로용 불변 tuple - 호출마다 list를 새로 만들지 않음
+        self._participants_by_lang = {
+            lang: tuple(ids) for lang, ids in index.items()
+        }
+        self._strategy_valid = False
+
+    def set_speaker(self, speaker: Speaker):
+        """스피커 교체 (전략/proto 캐시 무효화)"""
+        self.speaker = speaker
+        self._speaker_proto = None
+        self._strategy_valid = False
+
+    def update_participant_settings(
+        self, participant_id: str, target_language: str, translation_enabled: bool
+    ) -> bool:
+        """참가자 설정 변경 + 인덱스 갱신. 참가자가 없으면 False"""
+        p = self.participants.get(participant_id)
+        if p is None:
+            return False
+        p.target_language = target_language
+        p.translation_enabled = translation_enabled
+        # 설정 변경은 드물어 전체 재구성으로 충분 (읽기 경로가 hot)
+        self.rebuild_language_index()
+        return True
+
+    def release_vad(self):
+        """VAD 인스턴스를 풀에 반납 (세션 종료 시 1회, 중복 호출 안전)"""
+        if self.vad is not None:
+            release_vad(self.vad)
+            self.vad = None
+
+    def append_audio(self, chunk: bytes):
+        """사전 할당된 버퍼에 슬라이스 대입으로 추가 (재할당 없음)"""
+        end = self.audio_len + len(chunk)
+        if end > len(self.audio_buffer):
+            # 드물게 용량을 넘으면 그때만 확장 (이후 세션 수명 동안 재사용)
+            self.audio_buffer.extend(bytes(end - len(self.audio_buffer)))
+        self.audio_buffer[self.audio_len:end] = chunk
+        self.audio_len = end
+
+    def peek_audio(self) -> bytes:
+        """버퍼를 비우지 않고 현재 누적 오디오 스냅샷 반환 (부분 전사용)"""
+        return bytes(memoryview(self.audio_buffer)[:self.audio_len])
+
+    def take_audio(self) -> bytes:
+        """누적 오디오를 꺼내고 버퍼를 비움 (용량은 유지)"""
+        data = bytes(memoryview(self.audio_buffer)[:self.audio_len])
+        self.audio_len = 0
+        return data
 
-    def get_participants_by_target_language(self, target_lang: str) -> List[str]:
-        """특정 타겟 언어를 원하는 참가자 ID 목록"""
-        return [
-            p.participant_id for p in self.participants.values()
-            if p.translation_enabled and p.target_language == target_lang
-        ]
+    def get_target_languages(self) -> Set[str]:
+        """번역이 활성화된 참가자들의 타겟 언어 목록 (인덱스 조회)"""
+        source_lang = self.speaker.source_language
+        return {lang for lang in self.target_lang_index if lang != source_lang}
+
+    def get_participants_by_target_language(self, target_lang: str) -> Tuple[str, ...]:
+        """특정 타겟 언어를 원하는 참가자 ID tuple (캐시된 불변 객체 반환)"""
+        return self._participants_by_lang.get(target_lang, ())
 
     def determine_primary_strategy(self) -> BufferingStrategy:
         """
         모든 타겟 언어를 고려하여 주요 버퍼링 전략 결정
         하나라도 SENTENCE_BASED가 필요하면 SENTENCE_BASED 사용
+        (참가자/스피커가 바뀌기 전까지는 캐시된 결과 반환)
         """
+        if self._strategy_valid:
+            return self.primary_strategy
+
         source_lang = self.speaker.source_language
+        self.primary_strategy = BufferingStrategy.CHUNK_BASED
 
         for target_lang in self.get_target_languages():
             strategy = LanguageTopology.get_strategy(source_lang, target_lang)
             if strategy == BufferingStrategy.SENTENCE_BASED:
                 self.primary_strategy = BufferingStrategy.SENTENCE_BASED
-                return self.primary_strategy
+                break
 
-        self.primary_strategy = BufferingStrategy.CHUNK_BASED
+        self._strategy_valid = True
         return self.primary_strategy
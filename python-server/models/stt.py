@@ -6,11 +6,14 @@ Multi-model support: NeMo, faster-whisper, Amazon Transcribe
 import os
 import re
 import time
+import atexit
 import asyncio
 import tempfile
+import threading
 from typing import Tuple, List
 
 import numpy as np
+import torch
 
 from config.settings import Config
 from utils.logger import DebugLogger
@@ -30,6 +33,157 @@ try:
 except ImportError:
     AMAZON_TRANSCRIBE_AVAILABLE = False
 
+try:
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_PIPELINE_AVAILABLE = True
+except ImportError:
+    BATCHED_PIPELINE_AVAILABLE = False
+
+
+if AMAZON_TRANSCRIBE_AVAILABLE:
+    class _TranscribeResultHandler(TranscriptResultStreamHandler):
+        """
+        Amazon Transcribe 결과 핸들러
+
+        클래스 객체 생성(MRO/descriptor 구성)을 STT 호출마다 반복하지 않도록
+        모듈 레벨에 1회 정의한다. 평균 신뢰도는 온라인으로 누적.
+        """
+
+        def __init__(self, stream):
+            super().__init__(stream)
+            self.text_parts: List[str] = []
+            self.sum_conf: float = 0.0
+            self.count: int = 0
+
+        async def handle_transcript_event(self, event: TranscriptEvent):
+            results = event.transcript.results
+            for result in results:
+                if not result.is_partial:
+                    for alt in result.alternatives:
+                        text = alt.transcript.strip()
+                        conf = alt.confidence if hasattr(alt, 'confidence') and alt.confidence else 0.95
+                        if text:
+                            self.text_parts.append(text)
+                            self.sum_conf += conf
+                            self.count += 1
+                            DebugLogger.log("TRANSCRIBE", f"Segment: {text[:50]}", {"conf": f"{conf:.2f}"})
+
+
+# Hallucination filter용 정규식 (호출마다 컴파일하지 않도록 모듈 로드 시 1회)
+_STRIP_RE = re.compile(r'[ .]')
+_DOT_PATTERN = re.compile(r'(\S+)\.\.+')
+
+# Config가 list로 로드되더라도 멤버십 검사가 O(1)이 되도록 frozenset으로 고정
+_ARTIFACT_SET = frozenset(p.casefold() for p in Config.AUDIO_ARTIFACT_PATTERNS)
+
+# int16 변환용 scratch 버퍼 (세션 최대 버퍼 30초 기준, 스레드별 재사용)
+_SCRATCH_SAMPLES = Config.SAMPLE_RATE * 30
+_scratch_tls = threading.local()
+
+# model.transcribe 고정 인자 - Config는 startup 이후 불변이므로 모듈 로드 시 1회 구성
+# (호출마다 vad_parameters dict/suppress_tokens list를 새로 만들지 않음)
+_WHISPER_TRANSCRIBE_KWARGS = dict(
+    beam_size=Config.WHISPER_BEAM_SIZE,
+    best_of=Config.WHISPER_BEST_OF,
+    temperature=Config.WHISPER_TEMPERATURE,
+    # 업스트림 VADProcessor가 이미 음성만 버퍼링했으면 Silero VAD 재실행은 중복
+    vad_filter=not Config.WHISPER_SKIP_VAD,
+    vad_parameters=dict(
+        min_silence_duration_ms=200,
+        speech_pad_ms=100,
+    ),
+    condition_on_previous_text=False,
+    without_timestamps=True,
+    suppress_blank=True,
+    suppress_tokens=[-1],
+    no_speech_threshold=0.6,
+    log_prob_threshold=-0.8,
+    compression_ratio_threshold=2.0,
+)
+
+# pinned staging 상한 (60초 초과 버퍼는 일회성 경로로)
+_PINNED_SAMPLES = Config.SAMPLE_RATE * 60
+
+
+def _stage_audio_cuda(audio_data: np.ndarray):
+    """
+    NeMo 입력용 H2D 스테이징
+
+    pageable 메모리에서의 cudaMemcpy는 동기화되지만, pinned 버퍼를 경유하면
+    non_blocking 복사가 직전 커널과 겹친다. 버퍼는 스레드별로 재사용.
+    """
+    if Config.WHISPER_DEVICE != "cuda":
+        return audio_data
+
+    n = audio_data.size
+    if n > _PINNED_SAMPLES:
+        return torch.from_numpy(audio_data).to("cuda", non_blocking=True)
+
+    pinned = getattr(_scratch_tls, "pinned", None)
+    if pinned is None:
+        pinned = _scratch_tls.pinned = torch.empty(
+            _PINNED_SAMPLES, dtype=torch.float32, pin_memory=True
+        )
+
+    staging = pinned[:n]
+    staging.copy_(torch.from_numpy(audio_data))
+    return staging.to("cuda", non_blocking=True)
+
+
+# NeMo 파일 fallback용 고정 scratch 경로 (가능하면 tmpfs → 디스크 I/O 없음)
+_NEMO_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+_nemo_scratch_paths = []
+
+
+def _nemo_scratch_path() -> str:
+    """스레드별 고정 scratch WAV 경로 (매 호출 open/unlink 대신 덮어쓰기)"""
+    path = getattr(_scratch_tls, "nemo_wav", None)
+    if path is None:
+        path = os.path.join(
+            _NEMO_SCRATCH_DIR,
+            f"nemo_scratch_{os.getpid()}_{threading.get_ident()}.wav",
+        )
+        _scratch_tls.nemo_wav = path
+        _nemo_scratch_paths.append(path)
+    return path
+
+
+@atexit.register
+def _cleanup_nemo_scratch():
+    for path in _nemo_scratch_paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _float32_to_int16(audio_data: np.ndarray) -> np.ndarray:
+    """
+    float32 [-1, 1] → int16 변환을 단일 패스로 수행
+
+    (x * 32768).clip(...).astype(int16)는 버퍼를 3회 순회하며 임시 배열을
+    2개 만들지만, 여기서는 스레드별 scratch 버퍼에 in-place로 기록한다.
+    반환 배열은 scratch의 view이므로 다음 호출 전까지만 유효하다.
+    """
+    n = audio_data.size
+    if n > _SCRATCH_SAMPLES:
+        # 비정상적으로 긴 버퍼는 일회성 할당으로 처리
+        return (audio_data * 32767.0).clip(-32768, 32767).astype(np.int16)
+
+    f32 = getattr(_scratch_tls, "f32", None)
+    if f32 is None:
+        f32 = _scratch_tls.f32 = np.empty(_SCRATCH_SAMPLES, dtype=np.float32)
+        _scratch_tls.i16 = np.empty(_SCRATCH_SAMPLES, dtype=np.int16)
+
+    out_f = f32[:n]
+    np.multiply(audio_data, 32767.0, out=out_f)
+    np.clip(out_f, -32768, 32767, out=out_f)
+    np.rint(out_f, out=out_f)
+
+    out_i = _scratch_tls.i16[:n]
+    np.copyto(out_i, out_f, casting="unsafe")
+    return out_i
+
 
 class STTMixin:
     """STT 관련 메서드를 제공하는 Mixin 클래스"""
@@ -45,54 +199,57 @@ class STTMixin:
         if not text:
             return False
 
-        text_lower = text.lower().strip()
+        text_lower = text.casefold().strip()
 
         # Only filter if the entire text is an artifact pattern
-        if text_lower in Config.AUDIO_ARTIFACT_PATTERNS:
+        if text_lower in _ARTIFACT_SET:
             return True
 
         # =====================================================
         # Repetitive Pattern Detection (Hallucination Filter)
         # =====================================================
         words = text_lower.split()
+        n_words = len(words)
 
-        # 1. Single word repeated many times (e.g., "음 음 음 음 음")
-        if len(words) >= 5:
-            if len(set(words)) == 1:
+        if n_words >= 5:
+            unique_words = len(set(words))
+
+            # 1. Single word repeated many times (e.g., "음 음 음 음 음")
+            if unique_words == 1:
                 return True
 
-        # 2. Two-word pattern repeated (e.g., "릴리 릴리 릴리 릴리")
-        if len(words) >= 4:
-            # Check if all words are the same
-            unique_words = set(words)
-            if len(unique_words) <= 2 and len(words) >= 6:
+            # 2. Two-word pattern repeated (e.g., "릴리 릴리 릴리 릴리")
+            if unique_words <= 2 and n_words >= 6:
                 return True
 
         # 3. Detect "X.. X.. X.." pattern (e.g., "잘.. 잘.. 잘..")
-        # Pattern: same word followed by dots, repeated
-        dot_pattern = re.findall(r'(\S+)\.\.+', text_lower)
-        if len(dot_pattern) >= 3:
-            if len(set(dot_pattern)) == 1:
+        # '..' substring 검사(C 스캔)로 정규식/리스트 할당을 통째로 생략
+        if '..' in text_lower:
+            dot_pattern = _DOT_PATTERN.findall(text_lower)
+            if len(dot_pattern) >= 3 and len(set(dot_pattern)) == 1:
                 return True
 
         # 4. Detect repeated character sequences (e.g., "강강강강강강")
         # If more than 60% of text is the same character repeated
-        if len(text_lower) >= 10:
-            char_counts = {}
-            for char in text_lower:
-                if char not in ' .':
-                    char_counts[char] = char_counts.get(char, 0) + 1
-            if char_counts:
-                max_count = max(char_counts.values())
-                total_chars = sum(char_counts.values())
-                if total_chars > 0 and max_count / total_chars > 0.6:
-                    return True
-
         # 5. Very long text with very few unique characters (hallucination)
-        if len(text_lower) >= 50:
-            unique_chars = set(text_lower.replace(' ', '').replace('.', ''))
-            if len(unique_chars) <= 3:
-                return True
+        # → per-char dict 루프 대신 numpy로 벡터화 (한글/한자 멀티바이트도 동일 비용)
+        if len(text_lower) >= 10:
+            # Prefilter: 정상 발화는 여기서 거의 전부 탈락 → 히스토그램 생략
+            # (str.count는 C 레벨 스캔이라 np.unique보다 훨씬 저렴)
+            prefix = text_lower[:32]
+            probe_char = max(set(prefix), key=prefix.count)
+            repetition_suspect = text_lower.count(probe_char) / len(text_lower) > 0.5
+            low_variety_suspect = len(text_lower) >= 50 and len(set(text_lower[:64])) <= 6
+
+            if repetition_suspect or low_variety_suspect:
+                stripped = _STRIP_RE.sub('', text_lower)
+                if stripped:
+                    chars = np.frombuffer(stripped.encode('utf-32-le'), dtype=np.uint32)
+                    _, counts = np.unique(chars, return_counts=True)
+                    if counts.max() / chars.size > 0.6:
+                        return True
+                    if len(text_lower) >= 50 and counts.size <= 3:
+                        return True
 
         return False
 
@@ -130,23 +287,15 @@ class STTMixin:
             DebugLogger.log("STT_ERROR", "Amazon Transcribe not available")
             return "", 0.0
 
-        client = TranscribeStreamingClient(region=self.transcribe_region)
-
-        class ResultHandler(TranscriptResultStreamHandler):
-            def __init__(self, stream):
-                super().__init__(stream)
-                self.transcripts: List[Tuple[str, float]] = []
-
-            async def handle_transcript_event(self, event: TranscriptEvent):
-                results = event.transcript.results
-                for result in results:
-                    if not result.is_partial:
-                        for alt in result.alternatives:
-                            text = alt.transcript.strip()
-                            conf = alt.confidence if hasattr(alt, 'confidence') and alt.confidence else 0.95
-                            if text:
-                                self.transcripts.append((text, conf))
-                                DebugLogger.log("TRANSCRIBE", f"Segment: {text[:50]}", {"conf": f"{conf:.2f}"})
+        # 클라이언트 생성은 aiohttp 세션/credential 체인 구성을 동반하므로 region별 1회만
+        clients = getattr(self, "_transcribe_clients", None)
+        if clients is None:
+            clients = self._transcribe_clients = {}
+        client = clients.get(self.transcribe_region)
+        if client is None:
+            client = clients[self.transcribe_region] = TranscribeStreamingClient(
+                region=self.transcribe_region
+            )
 
         try:
             stream = await client.start_stream_transcription(
@@ -155,23 +304,21 @@ class STTMixin:
                 media_encoding="pcm",
             )
 
-            handler = ResultHandler(stream.output_stream)
+            handler = _TranscribeResultHandler(stream.output_stream)
+
+            chunk_size = 32768  # 32kB: 이벤트 루프 wakeup을 8kB 대비 1/4로
 
-            chunk_size = 8192
             async def send_audio():
-                for i in range(0, len(audio_bytes), chunk_size):
-                    chunk = audio_bytes[i:i + chunk_size]
-                    await stream.input_stream.send_audio_event(audio_chunk=chunk)
+                # memoryview 슬라이스는 복사 없이 view만 생성 (bytes 슬라이스는 매번 복사)
+                mv = memoryview(audio_bytes)
+                for i in range(0, len(mv), chunk_size):
+                    await stream.input_stream.send_audio_event(audio_chunk=mv[i:i + chunk_size])
                 await stream.input_stream.end_stream()
 
             await asyncio.gather(send_audio(), handler.handle_events())
 
-            if handler.transcripts:
-                texts = [t[0] for t in handler.transcripts]
-                confidences = [t[1] for t in handler.transcripts]
-                full_text = " ".join(texts)
-                avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-                return full_text, avg_confidence
+            if handler.count:
+                return " ".join(handler.text_parts), handler.sum_conf / handler.count
             else:
                 return "", 0.0
 
@@ -179,6 +326,19 @@ class STTMixin:
             DebugLogger.log("TRANSCRIBE_ERROR", f"Amazon Transcribe failed: {e}")
             return "", 0.0
 
+    def _transcribe_nemo_via_file(self, audio_data: np.ndarray, model) -> list:
+        """
+        구버전 NeMo용 fallback: 임시 WAV 파일을 경유하는 전사 경로
+        (direct array 입력이 지원되면 호출되지 않음)
+        """
+        if not SOUNDFILE_AVAILABLE:
+            DebugLogger.log("STT_ERROR", "soundfile not available for NeMo")
+            return []
+
+        scratch_path = _nemo_scratch_path()
+        sf.write(scratch_path, _float32_to_int16(audio_data), Config.SAMPLE_RATE)
+        return model.transcribe([scratch_path])
+
     def _transcribe_nemo(self, audio_data: np.ndarray, model, language: str) -> Tuple[str, float]:
         """
         Transcribe using NVIDIA NeMo model (e.g., Canary)
@@ -191,19 +351,14 @@ class STTMixin:
         Returns:
             (text, confidence)
         """
-        if not SOUNDFILE_AVAILABLE:
-            DebugLogger.log("STT_ERROR", "soundfile not available for NeMo")
-            return "", 0.0
-
         try:
-            # NeMo requires audio file input
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                temp_path = f.name
-                audio_int16 = (audio_data * 32767).clip(-32768, 32767).astype(np.int16)
-                sf.write(temp_path, audio_int16, Config.SAMPLE_RATE)
-
-            transcriptions = model.transcribe([temp_path])
-            os.unlink(temp_path)
+            # 최신 NeMo는 1-D float32 배열 직접 입력 지원 → 디스크 왕복 제거
+            try:
+                audio_input = _stage_audio_cuda(audio_data)
+                transcriptions = model.transcribe(audio=[audio_input], batch_size=1)
+            except TypeError:
+                # 구버전 NeMo: 파일 경로만 지원
+                transcriptions = self._transcribe_nemo_via_file(audio_data, model)
 
             if transcriptions and len(transcriptions) > 0:
                 if isinstance(transcriptions[0], str):
@@ -237,40 +392,37 @@ class STTMixin:
         """
         whisper_lang = Config.WHISPER_LANG_CODES.get(language, "en")
 
+        # BatchedInferencePipeline이면 세그먼트를 padded batch로 encoder에 투입
+        batch_kwargs = {}
+        if BATCHED_PIPELINE_AVAILABLE and isinstance(model, BatchedInferencePipeline):
+            batch_kwargs["batch_size"] = Config.WHISPER_BATCH_SIZE
+
+        # (내부 VAD를 켠 경우에도) 5초 미만 클립은 VAD 생략 - 침묵/무음은 이미
+        # RMS 게이트에서 걸렀고, 짧은 발화에서는 VAD 전처리 비용이 상대적으로 크다
+        call_kwargs = _WHISPER_TRANSCRIBE_KWARGS
+        if _WHISPER_TRANSCRIBE_KWARGS["vad_filter"] and audio_data.size < Config.SAMPLE_RATE * 5:
+            call_kwargs = dict(_WHISPER_TRANSCRIBE_KWARGS, vad_filter=False)
+
         segments, info = model.transcribe(
             audio_data,
             language=whisper_lang,
-            beam_size=Config.WHISPER_BEAM_SIZE,
-            best_of=Config.WHISPER_BEST_OF,
-            temperature=Config.WHISPER_TEMPERATURE,
-            vad_filter=True,
-            vad_parameters=dict(
-                min_silence_duration_ms=200,
-                speech_pad_ms=100,
-            ),
-            condition_on_previous_text=False,
-            without_timestamps=True,
-            suppress_blank=True,
-            suppress_tokens=[-1],
-            no_speech_threshold=0.6,
-            log_prob_threshold=-0.8,
-            compression_ratio_threshold=2.0,
+            **batch_kwargs,
+            **call_kwargs,
         )
 
-        texts = []
-        max_no_speech_prob = 0.0
-
-        for segment in segments:
-            segment_text = segment.text.strip()
-            max_no_speech_prob = max(max_no_speech_prob, segment.no_speech_prob)
+        # generator를 즉시 소진 - 이후 검사 동안 decode 상태를 붙잡지 않음
+        segs = list(segments)
+        max_no_speech_prob = max((s.no_speech_prob for s in segs), default=0.0)
 
+        texts = []
+        for segment in segs:
             if segment.no_speech_prob > 0.6:
                 continue
 
-            if self._is_audio_artifact(segment_text):
-                continue
-
-            if segment_text:
+            # 세그먼트 단계에서는 저렴한 exact-artifact 조회만 수행
+            # (반복 패턴 휴리스틱은 합쳐진 텍스트에 1회만 돌린다)
+            segment_text = segment.text.strip()
+            if segment_text and segment_text.casefold() not in _ARTIFACT_SET:
                 texts.append(segment_text)
 
         result_text = " ".join(texts).strip()
@@ -285,6 +437,37 @@ class STTMixin:
 
         return result_text, confidence
 
+    async def atranscribe(self, audio_data: np.ndarray, language: str) -> Tuple[str, float]:
+        """
+        비동기 STT 진입점 (이벤트 루프에서 실행되는 코드용)
+
+        - Amazon Transcribe: 루프에서 직접 await → run_async 스레드 홉 제거
+        - Whisper/NeMo: compute 바운드이므로 worker 스레드로 오프로드
+
+        Returns:
+            (text, confidence)
+        """
+        if Config.STT_BACKEND == "transcribe" and AMAZON_TRANSCRIBE_AVAILABLE:
+            start_time = time.time()
+
+            audio_rms = np.sqrt(np.dot(audio_data, audio_data) / audio_data.size)
+            audio_duration = audio_data.size / Config.SAMPLE_RATE
+            if audio_rms < 0.001 or audio_duration < Config.MIN_AUDIO_DURATION:
+                return "", 0.0
+
+            transcribe_lang = Config.TRANSCRIBE_LANG_CODES.get(language, "en-US")
+            audio_bytes = _float32_to_int16(audio_data).tobytes()
+
+            result_text, confidence = await self._transcribe_streaming(audio_bytes, transcribe_lang)
+
+            latency_ms = (time.time() - start_time) * 1000
+            if result_text:
+                DebugLogger.stt_result(result_text, confidence, latency_ms)
+            return result_text, confidence
+
+        # Whisper/NeMo 경로는 CT2/CUDA가 GIL을 놓으므로 스레드 오프로드로 충분
+        return await asyncio.to_thread(self.transcribe, audio_data, language)
+
     def transcribe(self, audio_data: np.ndarray, language: str) -> Tuple[str, float]:
         """
         Speech to Text - Routes to appropriate model based on language and backend
@@ -298,29 +481,40 @@ class STTMixin:
         """
         start_time = time.time()
 
-        DebugLogger.stt_start(len(audio_data) * 4, language)
+        # 핫패스 로그는 호출 전에 가드해 인자 포맷 비용까지 생략
+        debug = DebugLogger.enabled()
+        # startup 이후 불변인 설정은 로컬로 바인딩 (Config.__dict__ 조회 제거)
+        backend = Config.STT_BACKEND
+
+        if debug:
+            DebugLogger.stt_start(len(audio_data) * 4, language)
 
         # Audio validation
-        audio_rms = np.sqrt(np.mean(audio_data ** 2))
+        # np.dot은 BLAS 단일 패스 - mean(x**2)처럼 제곱 임시 배열을 만들지 않음
+        audio_rms = np.sqrt(np.dot(audio_data, audio_data) / audio_data.size)
         audio_duration = len(audio_data) / Config.SAMPLE_RATE
 
-        DebugLogger.log("STT_AUDIO", f"Audio analysis", {
-            "samples": len(audio_data),
-            "duration_sec": f"{audio_duration:.2f}",
-            "rms": f"{audio_rms:.4f}",
-            "max": f"{np.max(np.abs(audio_data)):.4f}",
-            "language": language,
-            "backend": Config.STT_BACKEND
-        })
+        if debug:
+            # max(|x|)는 로그 전용이므로 디버그 모드에서만 계산
+            DebugLogger.log("STT_AUDIO", f"Audio analysis", {
+                "samples": len(audio_data),
+                "duration_sec": f"{audio_duration:.2f}",
+                "rms": f"{audio_rms:.4f}",
+                "max": f"{np.max(np.abs(audio_data)):.4f}",
+                "language": language,
+                "backend": backend
+            })
 
         # Skip if audio is too quiet
         if audio_rms < 0.001:
-            DebugLogger.log("STT_SKIP", "Silence detected", {"rms": f"{audio_rms:.6f}"})
+            if debug:
+                DebugLogger.log("STT_SKIP", "Silence detected", {"rms": f"{audio_rms:.6f}"})
             return "", 0.0
 
         # Skip if audio is too short
         if audio_duration < Config.MIN_AUDIO_DURATION:
-            DebugLogger.log("STT_SKIP", "Audio too short", {"duration": f"{audio_duration:.2f}"})
+            if debug:
+                DebugLogger.log("STT_SKIP", "Audio too short", {"duration": f"{audio_duration:.2f}"})
             return "", 0.0
 
         try:
@@ -328,20 +522,23 @@ class STTMixin:
             confidence = 0.0
 
             # ===== Multi-Model Backend (Language-Specific) =====
-            if Config.STT_BACKEND == "multi":
+            if backend == "multi":
                 if language in self.nemo_models:
                     model = self.nemo_models[language]
-                    DebugLogger.log("STT_ROUTE", f"Using NeMo model for {language}")
+                    if debug:
+                        DebugLogger.log("STT_ROUTE", f"Using NeMo model for {language}")
                     result_text, confidence = self._transcribe_nemo(audio_data, model, language)
 
                 elif language in self.whisper_models:
                     model = self.whisper_models[language]
-                    DebugLogger.log("STT_ROUTE", f"Using Whisper model for {language}: {Config.MULTI_MODEL_STT[language]['model']}")
+                    if debug:
+                        DebugLogger.log("STT_ROUTE", f"Using Whisper model for {language}: {Config.MULTI_MODEL_STT[language]['model']}")
                     result_text, confidence = self._transcribe_whisper(audio_data, model, language, audio_rms)
 
                 elif "fallback" in self.whisper_models:
                     model = self.whisper_models["fallback"]
-                    DebugLogger.log("STT_ROUTE", f"Using fallback model for {language}")
+                    if debug:
+                        DebugLogger.log("STT_ROUTE", f"Using fallback model for {language}")
                     result_text, confidence = self._transcribe_whisper(audio_data, model, language, audio_rms)
 
                 else:
@@ -349,12 +546,12 @@ class STTMixin:
                     return "", 0.0
 
             # ===== Amazon Transcribe Backend =====
-            elif Config.STT_BACKEND == "transcribe" and AMAZON_TRANSCRIBE_AVAILABLE:
+            elif backend == "transcribe" and AMAZON_TRANSCRIBE_AVAILABLE:
                 transcribe_lang = Config.TRANSCRIBE_LANG_CODES.get(language, "en-US")
-                DebugLogger.log("STT_LANG", f"Using Amazon Transcribe: {transcribe_lang}")
+                if debug:
+                    DebugLogger.log("STT_LANG", f"Using Amazon Transcribe: {transcribe_lang}")
 
-                audio_int16 = (audio_data * 32768).clip(-32768, 32767).astype(np.int16)
-                audio_bytes = audio_int16.tobytes()
+                audio_bytes = _float32_to_int16(audio_data).tobytes()
 
                 result_text, confidence = self.async_manager.run_async(
                     self._transcribe_streaming(audio_bytes, transcribe_lang),
@@ -364,19 +561,26 @@ class STTMixin:
             # ===== faster-whisper Backend (Single Model) =====
             elif self.whisper_model:
                 whisper_lang = Config.WHISPER_LANG_CODES.get(language, "en")
-                DebugLogger.log("STT_LANG", f"Using faster-whisper: {whisper_lang}")
+                if debug:
+                    DebugLogger.log("STT_LANG", f"Using faster-whisper: {whisper_lang}")
                 result_text, confidence = self._transcribe_whisper(audio_data, self.whisper_model, language, audio_rms)
 
             else:
                 DebugLogger.log("STT_ERROR", "No STT backend available")
                 return "", 0.0
 
-            latency_ms = (time.time() - start_time) * 1000
+            if debug:
+                latency_ms = (time.time() - start_time) * 1000
+                if result_text:
+                    DebugLogger.stt_result(result_text, confidence, latency_ms)
+                else:
+                    DebugLogger.log("STT_EMPTY", f"No valid text detected", {"latency_ms": f"{latency_ms:.0f}"})
 
-            if result_text:
-                DebugLogger.stt_result(result_text, confidence, latency_ms)
-            else:
-                DebugLogger.log("STT_EMPTY", f"No valid text detected", {"latency_ms": f"{latency_ms:.0f}"})
+            # 장기 구동 시 VRAM sawtooth 방지: 매 요청이 아닌 N회마다 캐시 블록 반환
+            self._stt_call_count = getattr(self, "_stt_call_count", 0) + 1
+            if (Config.WHISPER_DEVICE == "cuda"
+                    and self._stt_call_count % Config.STT_CACHE_RELEASE_EVERY == 0):
+                torch.cuda.empty_cache()
 
             return result_text, confidence
 
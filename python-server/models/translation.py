@@ -3,16 +3,95 @@ Translation Mixin
 AWS Translate and Qwen3 LLM support
 """
 
+import re
 import time
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+
 import torch
 
 from config.settings import Config
 from utils.logger import DebugLogger
 
 
+# _clean_translation용: LLM 상투 prefix들을 한 번의 C 레벨 매칭으로 제거
+# (prefix마다 lower() + startswith를 반복하던 Python 루프 대체)
+_PREFIX_RE = re.compile(
+    r"^\s*(?:here(?:'s|\s+is)\s+the\s+translation"
+    r"|the\s+translation\s+is"
+    r"|translated\s+text"
+    r"|translation)\s*:\s*",
+    re.IGNORECASE,
+)
+
+
+class QwenTranslationBatcher:
+    """
+    Qwen 번역 마이크로 배처
+
+    여러 worker 스레드에서 동시에 들어오는 번역 요청을 짧은 윈도우 동안 모아
+    한 번의 generate 호출로 처리한다. left-padding이면 프롬프트(언어쌍)가
+    서로 달라도 생성 시작점이 정렬되므로 언어쌍별로 나눌 필요가 없다.
+    8B 모델의 decode는 memory-bound라 배치 크기에 거의 둔감하므로
+    동시 요청 수만큼 처리량이 늘어난다.
+    """
+
+    __slots__ = ("_lock", "_pending", "_flushing", "_window_s", "_max_batch", "_batch_fn")
+
+    def __init__(self, batch_fn):
+        self._lock = threading.Lock()
+        self._pending = []  # [(text, source_lang, target_lang, Future)]
+        self._flushing = False
+        self._window_s = Config.QWEN_BATCH_WINDOW_MS / 1000.0
+        self._max_batch = Config.QWEN_MAX_BATCH
+        self._batch_fn = batch_fn  # ([(text, source_lang, target_lang)]) -> List[str]
+
+    def submit(self, text: str, source_lang: str, target_lang: str) -> str:
+        """번역 요청 제출. 윈도우 내 동시 요청은 한 배치로 묶인다."""
+        future = Future()
+        with self._lock:
+            self._pending.append((text, source_lang, target_lang, future))
+            is_leader = not self._flushing
+            if is_leader:
+                self._flushing = True
+
+        if is_leader:
+            # leader가 윈도우만큼 대기 후 쌓인 요청을 모두 flush
+            time.sleep(self._window_s)
+            with self._lock:
+                batch = self._pending
+                self._pending = []
+                self._flushing = False
+            self._run_batch(batch)
+
+        return future.result(timeout=Config.TRANSLATION_TIMEOUT)
+
+    def _run_batch(self, batch):
+        # max_batch 초과분은 나눠서 실행 (padding 낭비 방지)
+        for i in range(0, len(batch), self._max_batch):
+            chunk = batch[i:i + self._max_batch]
+            items = [(text, src, tgt) for text, src, tgt, _ in chunk]
+            try:
+                results = self._batch_fn(items)
+                for (_, _, _, future), result in zip(chunk, results):
+                    future.set_result(result)
+            except Exception as e:
+                for _, _, _, future in chunk:
+                    if not future.done():
+                        future.set_exception(e)
+
+
 class TranslationMixin:
     """번역 관련 메서드를 제공하는 Mixin 클래스"""
 
+    @staticmethod
+    def _qwen_generate_kwargs() -> dict:
+        """compile 사용 시 CUDA-graph 친화적인 static KV cache로 생성"""
+        if Config.COMPILE_QWEN and Config.GPU_DEVICE == "cuda":
+            return {"cache_implementation": "static"}
+        return {}
+
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """
         Translate text using AWS Translate or Qwen3
@@ -36,7 +115,12 @@ class TranslationMixin:
         if Config.TRANSLATION_BACKEND == "aws":
             result = self._translate_aws(text, source_lang, target_lang)
         else:
-            result = self._translate_qwen(text, source_lang, target_lang)
+            # 동시 요청은 마이크로 배치로 묶어 generate 1회로 처리
+            batcher = getattr(self, "qwen_batcher", None)
+            if batcher is not None:
+                result = batcher.submit(text, source_lang, target_lang)
+            else:
+                result = self._translate_qwen(text, source_lang, target_lang)
 
         latency_ms = (time.time() - start_time) * 1000
         DebugLogger.translation_result(result, source_lang, target_lang, latency_ms)
@@ -66,17 +150,10 @@ class TranslationMixin:
             DebugLogger.log("TRANS_ERROR", f"AWS Translate failed: {e}")
             return self._translate_qwen(text, source_lang, target_lang)
 
-    def _translate_qwen(self, text: str, source_lang: str, target_lang: str) -> str:
-        """
-        Translate using Qwen3-8B LLM
-
-        Local inference, useful when AWS is not available.
-        """
-        source_name = Config.LANGUAGE_NAMES.get(source_lang, "English")
-        target_name = Config.LANGUAGE_NAMES.get(target_lang, "English")
-
-        try:
-            prompt = f"""Translate this {source_name} text to {target_name}.
+    @staticmethod
+    def _build_qwen_prompt(text: str, source_name: str, target_name: str) -> str:
+        """Qwen 번역 프롬프트 구성 (단건/배치 경로 공용)"""
+        return f"""Translate this {source_name} text to {target_name}.
 Rules:
 - Output ONLY the {target_name} translation
 - Do NOT include the original text
@@ -86,30 +163,166 @@ Text: {text}
 
 {target_name} translation:"""
 
-            messages = [{"role": "user", "content": prompt}]
+    def translate_batch(self, text: str, source_lang: str, target_langs: List[str]) -> Dict[str, str]:
+        """
+        한 발화를 여러 타겟 언어로 번역
+
+        Qwen 백엔드에서는 타겟 언어별 프롬프트를 left-padding 배치 하나로 묶어
+        generate 1회로 처리한다 (N개 언어 = prefill/decode 1회).
+        AWS Translate는 배치 API가 없으므로 언어별 호출로 폴백한다.
+
+        Returns:
+            {target_lang: translated_text}
+        """
+        if not text.strip():
+            return {lang: "" for lang in target_langs}
+
+        targets = [lang for lang in target_langs if lang != source_lang]
+        results = {source_lang: text} if source_lang in target_langs else {}
+
+        if not targets:
+            return results
+
+        if Config.TRANSLATION_BACKEND == "aws":
+            for lang in targets:
+                results[lang] = self._translate_aws(text, source_lang, lang)
+        else:
+            translated = self._translate_qwen_batch(
+                [(text, source_lang, lang) for lang in targets]
+            )
+            results.update(zip(targets, translated))
+
+        return results
+
+    def _translate_qwen_batch(self, items: List[Tuple[str, str, str]]) -> List[str]:
+        """
+        여러 (text, source, target) 요청을 left-padding 배치로 generate 1회에 태워 번역
 
-            input_text = self.qwen_tokenizer.apply_chat_template(
-                messages,
+        left-padding이므로 언어쌍이 달라 프롬프트가 서로 달라도 생성 시작점이 정렬된다.
+        """
+        if len(items) == 1:
+            return [self._translate_qwen(*items[0])]
+
+        tokenizer = self.qwen_tokenizer
+        # 캐시된 렌더 결과에 본문만 치환 (Jinja 렌더를 요청마다 반복하지 않음)
+        rendered = [
+            self._qwen_prompt_template(
+                Config.LANGUAGE_NAMES.get(src, "English"),
+                Config.LANGUAGE_NAMES.get(tgt, "English"),
+            ).replace(self._PROMPT_SENTINEL, text)
+            for text, src, tgt in items
+        ]
+
+        if tokenizer.pad_token is None:
+            tokenizer.pad_token = tokenizer.eos_token
+        tokenizer.padding_side = "left"  # left-padding이어야 생성 시작점이 정렬됨
+
+        inputs = tokenizer(
+            rendered,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=512,
+        ).to(self.qwen_model.device)
+
+        with torch.no_grad():
+            outputs = self.qwen_model.generate(
+                **inputs,
+                max_new_tokens=256,
+                do_sample=False,
+                pad_token_id=tokenizer.eos_token_id,
+                **self._qwen_generate_kwargs(),
+            )
+
+        # left-padding이므로 모든 행의 prompt 길이가 동일
+        input_len = inputs["input_ids"].shape[1]
+        decoded = tokenizer.batch_decode(outputs[:, input_len:], skip_special_tokens=True)
+        return [self._clean_translation(t.strip()) for t in decoded]
+
+    # 프롬프트에서 가변부(text) 위치를 표시하는 sentinel (PUA 문자라 본문과 충돌 없음)
+    _PROMPT_SENTINEL = ""
+
+    def _qwen_prompt_template(self, source_name: str, target_name: str) -> str:
+        """
+        언어쌍별 chat template 렌더 결과 캐시
+
+        Jinja 렌더는 언어쌍마다 결과가 고정이므로 1회만 수행하고,
+        요청 시에는 sentinel 자리에 본문만 치환한다.
+        """
+        cache = getattr(self, "_qwen_tmpl_cache", None)
+        if cache is None:
+            cache = self._qwen_tmpl_cache = {}
+
+        key = (source_name, target_name)
+        template = cache.get(key)
+        if template is None:
+            template = cache[key] = self.qwen_tokenizer.apply_chat_template(
+                [{"role": "user", "content": self._build_qwen_prompt(
+                    self._PROMPT_SENTINEL, source_name, target_name)}],
                 tokenize=False,
                 add_generation_prompt=True,
-                enable_thinking=False
+                enable_thinking=False,
             )
-            inputs = self.qwen_tokenizer(
-                input_text,
-                return_tensors="pt",
+        return template
+
+    def _qwen_prompt_ids(self, source_name: str, target_name: str):
+        """
+        언어쌍별 프롬프트 prefix/suffix 토큰 ID 캐시
+
+        지시문(Rules 블록 포함)은 언어쌍마다 고정이므로 최초 1회만 토큰화하고,
+        요청 시에는 가변부(text)만 토큰화해 이어 붙인다.
+        """
+        cache = getattr(self, "_qwen_prompt_cache", None)
+        if cache is None:
+            cache = self._qwen_prompt_cache = {}
+
+        key = (source_name, target_name)
+        ids = cache.get(key)
+        if ids is None:
+            head, tail = self._qwen_prompt_template(source_name, target_name) \
+                .split(self._PROMPT_SENTINEL, 1)
+            prefix_ids = self.qwen_tokenizer(head, add_special_tokens=False).input_ids
+            suffix_ids = self.qwen_tokenizer(tail, add_special_tokens=False).input_ids
+            ids = cache[key] = (prefix_ids, suffix_ids)
+        return ids
+
+    def _translate_qwen(self, text: str, source_lang: str, target_lang: str) -> str:
+        """
+        Translate using Qwen3-8B LLM
+
+        Local inference, useful when AWS is not available.
+        """
+        source_name = Config.LANGUAGE_NAMES.get(source_lang, "English")
+        target_name = Config.LANGUAGE_NAMES.get(target_lang, "English")
+
+        try:
+            # 고정 지시문은 캐시된 토큰 ID 재사용, 가변부만 토큰화
+            prefix_ids, suffix_ids = self._qwen_prompt_ids(source_name, target_name)
+            text_ids = self.qwen_tokenizer(
+                text,
+                add_special_tokens=False,
                 truncation=True,
-                max_length=512
-            ).to(self.qwen_model.device)
+                max_length=384,
+            ).input_ids
+
+            input_ids = torch.tensor(
+                [prefix_ids + text_ids + suffix_ids],
+                dtype=torch.long,
+                device=self.qwen_model.device,
+            )
+            attention_mask = torch.ones_like(input_ids)
 
             with torch.no_grad():
                 outputs = self.qwen_model.generate(
-                    **inputs,
+                    input_ids=input_ids,
+                    attention_mask=attention_mask,
                     max_new_tokens=256,
                     do_sample=False,
                     pad_token_id=self.qwen_tokenizer.eos_token_id,
+                    **self._qwen_generate_kwargs(),
                 )
 
-            input_len = inputs["input_ids"].shape[1]
+            input_len = input_ids.shape[1]
             result = self.qwen_tokenizer.decode(
                 outputs[0][input_len:],
                 skip_special_tokens=True
@@ -127,15 +340,7 @@ Text: {text}
 
         Removes common prefixes and formatting issues from LLM output.
         """
-        result = text.strip()
-
-        prefixes = [
-            "Here is the translation:", "Here's the translation:",
-            "Translation:", "The translation is:", "Translated text:",
-        ]
-        for prefix in prefixes:
-            if result.lower().startswith(prefix.lower()):
-                result = result[len(prefix):].strip()
+        result = _PREFIX_RE.sub("", text.strip(), count=1)
 
         lines = [line.strip() for line in result.split('\n') if line.strip()]
         if len(lines) > 1:
@@ -49,17 +49,29 @@ class TTSMixin:
         voice_id, engine = self.VOICE_CONFIG.get(target_lang, ("Joanna", "neural"))
 
         try:
-            response = self.polly_client.synthesize_speech(
-                Text=text,
-                OutputFormat="mp3",
-                VoiceId=voice_id,
-                Engine=engine,
-                SampleRate="24000",
-            )
-
-            audio_data = response["AudioStream"].read()
-            # Estimate duration from audio size (rough estimate for MP3)
-            duration_ms = int(len(audio_data) / 24 * 8)
+            if Config.TTS_OUTPUT_FORMAT == "pcm":
+                # PCM이면 클라이언트의 MP3 디코드가 빠지고 길이도 정확히 계산됨
+                response = self.polly_client.synthesize_speech(
+                    Text=text,
+                    OutputFormat="pcm",
+                    VoiceId=voice_id,
+                    Engine=engine,
+                    SampleRate=str(Config.TTS_SAMPLE_RATE),
+                )
+                audio_data = response["AudioStream"].read()
+                # 16kHz × 16-bit mono = 32 bytes/ms (정확값)
+                duration_ms = len(audio_data) // 32
+            else:
+                response = self.polly_client.synthesize_speech(
+                    Text=text,
+                    OutputFormat="mp3",
+                    VoiceId=voice_id,
+                    Engine=engine,
+                    SampleRate=str(Config.TTS_SAMPLE_RATE),
+                )
+                audio_data = response["AudioStream"].read()
+                # Estimate duration from audio size (rough estimate for MP3)
+                duration_ms = int(len(audio_data) / 24 * 8)
 
             latency_ms = (time.time() - start_time) * 1000
             DebugLogger.tts_result(len(audio_data), duration_ms, latency_ms)
@@ -38,6 +38,17 @@ def serve():
         options=[
             ('grpc.max_receive_message_length', 50 * 1024 * 1024),
             ('grpc.max_send_message_length', 50 * 1024 * 1024),
+            # 지속 bidi 스트림용 HTTP/2 튜닝: flow-control 윈도우를 BDP 프로브로
+            # 자동 확장하고, 오디오 업스트림이 윈도우 업데이트에 막히지 않게 함
+            ('grpc.http2.bdp_probe', 1),
+            ('grpc.http2.lookahead_bytes', 4 * 1024 * 1024),
+            # NAT/LB 유휴 타임아웃으로 스트림이 끊기지 않도록 keepalive
+            ('grpc.keepalive_time_ms', 60000),
+            ('grpc.keepalive_timeout_ms', 10000),
+            ('grpc.keepalive_permit_without_calls', 0),
+            ('grpc.http2.min_time_between_pings_ms', 60000),
+            ('grpc.max_concurrent_streams', 1024),
+            ('grpc.so_reuseport', 1),
         ]
     )
 
@@ -3,17 +3,20 @@ gRPC Conversation Service
 양방향 스트리밍 오디오 처리 및 번역 서비스
 """
 
-import uuid
 import time
 import threading
+from concurrent.futures import TimeoutError as FuturesTimeout
 from typing import Dict, Optional
 
-import numpy as np
+import grpc
 
 from config.settings import Config
 from utils.logger import DebugLogger
+from utils.float32_pool import convert_int16_pooled, release_buffer
+from cache.room_cache import STTCoalescer, make_audio_hasher
 from models.session import Participant, Speaker, SessionState
 from language.topology import BufferingStrategy
+from services.room_processor import RoomProcessor
 
 import sys
 import os
@@ -21,19 +24,79 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from generated import conversation_pb2
 from generated import conversation_pb2_grpc
 
+# filler 검사용: casefold된 frozenset으로 1회 조회 (lower/원문 2회 조회 대체)
+_FILLER_FSET = frozenset(w.casefold() for w in Config.FILLER_WORDS)
+
+# 구간 측정용 단조 시계 (time.time()은 NTP 보정으로 역행 가능 + float 연산)
+# wall-clock이 필요한 timestamp_ms에만 time.time()을 유지한다
+_now = time.monotonic_ns
+
+# 스테이지 경계에서 스트림을 살린 채 복구하는 예외들. future.result(timeout=...)
+# 계열(STT coalescer, 캐시 single-flight, Qwen 배처)은 TimeoutError를 던진다 -
+# 3.11부터 concurrent.futures.TimeoutError가 builtin의 별칭이지만 이전
+# 버전에서는 별개 클래스라 둘 다 포함한다
+_STAGE_ERRORS = (RuntimeError, ValueError, TimeoutError, FuturesTimeout, grpc.RpcError)
+
 
 class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
     """gRPC 서비스 구현 (v10 - 상세 디버깅 포함)"""
 
+    # 세션 맵 샤드 수 (전역 락 1개 대신 session_id 해시로 경합 분산)
+    _SESSION_SHARDS = 16
+
     def __init__(self, model_manager):
         self.models = model_manager
-        self.sessions: Dict[str, SessionState] = {}
-        self.lock = threading.Lock()
+        self._session_shards = [{} for _ in range(self._SESSION_SHARDS)]
+        self._session_locks = [threading.Lock() for _ in range(self._SESSION_SHARDS)]
+        # room_id → session_id 역색인 (설정 변경 시 전체 세션 스캔 방지)
+        self._room_sessions: Dict[str, set] = {}
+        self._room_lock = threading.Lock()
+        # 동일 화자의 연속 STT 요청 병합 (최신 오디오만 처리)
+        self.stt_coalescer = STTCoalescer()
+
+    def _shard(self, session_id: str):
+        idx = hash(session_id) % self._SESSION_SHARDS
+        return self._session_shards[idx], self._session_locks[idx]
+
+    def _get_session(self, session_id: str) -> Optional[SessionState]:
+        shard, lock = self._shard(session_id)
+        with lock:
+            return shard.get(session_id)
+
+    def _put_session(self, session_id: str, state: SessionState):
+        shard, lock = self._shard(session_id)
+        with lock:
+            shard[session_id] = state
+        with self._room_lock:
+            self._room_sessions.setdefault(state.room_id, set()).add(session_id)
+
+    def _pop_session(self, session_id: str) -> Optional[SessionState]:
+        shard, lock = self._shard(session_id)
+        with lock:
+            state = shard.pop(session_id, None)
+        if state is not None:
+            with self._room_lock:
+                ids = self._room_sessions.get(state.room_id)
+                if ids:
+                    ids.discard(session_id)
+                    if not ids:
+                        self._room_sessions.pop(state.room_id, None)
+        return state
 
     def StreamChat(self, request_iterator, context):
         """양방향 스트리밍 RPC 처리"""
         session_state: Optional[SessionState] = None
         current_session_id = None
+        partial_sent_len = 0  # 마지막 부분 transcript 시점의 버퍼 길이
+        # 이 스트림의 세션 소유 표식 - 재연결로 새 스트림이 세션을 인계받으면
+        # 세션의 _stream_token이 교체되어 구 스트림의 정리 경로가 무효화된다
+        stream_token = object()
+
+        # 청크마다 반복되는 Config 속성 조회를 지역 변수로 (LOAD_ATTR 제거)
+        bytes_per_second = Config.BYTES_PER_SECOND
+        max_buffer_bytes = Config.SENTENCE_MAX_BYTES
+        min_speech_bytes = int(bytes_per_second * 0.5)
+        partial_interval_bytes = Config.PARTIAL_STT_INTERVAL_BYTES
 
         DebugLogger.log("STREAM", "New gRPC stream connected")
 
@@ -56,13 +119,13 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                     )
 
                     # 기존 세션이 있는지 확인
-                    with self.lock:
-                        existing_session = self.sessions.get(current_session_id)
+                    existing_session = self._get_session(current_session_id)
 
                     if existing_session:
                         # 기존 세션이 있으면 스피커 정보만 업데이트 (버퍼와 상태 유지)
-                        existing_session.speaker = speaker
+                        existing_session.set_speaker(speaker)
                         existing_session.determine_primary_strategy()
+                        existing_session._stream_token = stream_token
                         session_state = existing_session
 
                         DebugLogger.log("SPEAKER_UPDATE", f"Speaker updated", {
@@ -90,9 +153,9 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                         )
 
                         session_state.determine_primary_strategy()
+                        session_state._stream_token = stream_token
 
-                        with self.lock:
-                            self.sessions[current_session_id] = session_state
+                        self._put_session(current_session_id, session_state)
 
                         target_langs = session_state.get_target_languages()
 
@@ -125,84 +188,108 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
 
                 # 오디오 청크 처리
                 elif payload_type == 'audio_chunk' and session_state:
+                    debug = DebugLogger.enabled()
                     audio_chunk = request.audio_chunk
                     chunk_bytes = len(audio_chunk)
-                    audio_duration = chunk_bytes / Config.BYTES_PER_SECOND
+                    audio_duration = chunk_bytes / bytes_per_second
 
-                    DebugLogger.audio_received(current_session_id, chunk_bytes, audio_duration)
+                    if debug:
+                        DebugLogger.audio_received(current_session_id, chunk_bytes, audio_duration)
 
                     # VAD 처리
                     vad = session_state.vad
                     has_speech, is_sentence_end = vad.process_chunk(audio_chunk)
-                    buffer_duration = len(session_state.audio_buffer) / Config.BYTES_PER_SECOND
-
-                    DebugLogger.vad_result(has_speech, is_sentence_end, buffer_duration)
 
-                    min_speech_bytes = int(Config.BYTES_PER_SECOND * 0.5)
-                    max_buffer_bytes = Config.SENTENCE_MAX_BYTES
+                    if debug:
+                        buffer_duration = session_state.audio_len / bytes_per_second
+                        DebugLogger.vad_result(has_speech, is_sentence_end, buffer_duration)
 
                     if has_speech:
                         speech_audio = vad.filter_speech(audio_chunk)
                         if speech_audio:
-                            session_state.audio_buffer.extend(speech_audio)
+                            session_state.append_audio(speech_audio)
+                            session_state.audio_hasher.update(speech_audio)
 
                     should_process = False
                     process_reason = ""
 
-                    if is_sentence_end and len(session_state.audio_buffer) >= min_speech_bytes:
+                    if is_sentence_end and session_state.audio_len >= min_speech_bytes:
                         should_process = True
                         process_reason = "sentence_end"
-                    elif len(session_state.audio_buffer) >= max_buffer_bytes:
+                    elif session_state.audio_len >= max_buffer_bytes:
                         should_process = True
                         process_reason = "buffer_full"
 
                     if should_process:
-                        process_bytes = bytes(session_state.audio_buffer)
-                        session_state.audio_buffer.clear()
+                        partial_sent_len = 0
+                        process_bytes = session_state.take_audio()
+                        audio_hash = session_state.audio_hasher.intdigest()
+                        session_state.audio_hasher = make_audio_hasher()
                         if process_reason == "buffer_full":
                             vad.reset()
 
-                        DebugLogger.log("PROCESS", f"Processing audio buffer", {
-                            "reason": process_reason,
-                            "bytes": len(process_bytes),
-                            "duration_sec": f"{len(process_bytes) / Config.BYTES_PER_SECOND:.2f}"
-                        })
+                        if debug:
+                            DebugLogger.log("PROCESS", f"Processing audio buffer", {
+                                "reason": process_reason,
+                                "bytes": len(process_bytes),
+                                "duration_sec": f"{len(process_bytes) / bytes_per_second:.2f}"
+                            })
 
                         try:
-                            pipeline_start = time.time()
+                            pipeline_start = _now()
 
-                            for response in self._process_audio(session_state, process_bytes, True):
+                            for response in self._process_audio(session_state, process_bytes, True,
+                                                                audio_hash=audio_hash):
                                 yield response
 
-                            pipeline_latency = (time.time() - pipeline_start) * 1000
-                            DebugLogger.log("PIPELINE_DONE", f"Pipeline complete", {
-                                "total_latency_ms": f"{pipeline_latency:.0f}"
-                            })
+                            if debug:
+                                pipeline_latency = (_now() - pipeline_start) // 1_000_000
+                                DebugLogger.log("PIPELINE_DONE", f"Pipeline complete", {
+                                    "total_latency_ms": pipeline_latency
+                                })
 
-                        except Exception as proc_err:
+                        except _STAGE_ERRORS as proc_err:
                             DebugLogger.log("PROCESS_ERROR", f"Audio processing failed: {proc_err}")
 
+                    # 문장 완성 전이라도 일정 간격마다 미확정 transcript를 먼저 방출
+                    # (번역/TTS 없이 STT만 - 최종 파이프라인이 정식 결과로 덮어씀)
+                    elif (partial_interval_bytes
+                          and session_state.audio_len >= min_speech_bytes
+                          and session_state.audio_len - partial_sent_len
+                              >= partial_interval_bytes):
+                        partial_sent_len = session_state.audio_len
+                        try:
+                            response = self._partial_transcript(session_state)
+                            if response is not None:
+                                yield response
+                        except _STAGE_ERRORS as proc_err:
+                            DebugLogger.log("PARTIAL_ERROR", f"Partial STT failed: {proc_err}")
+
                 # 세션 종료
                 elif payload_type == 'session_end':
                     if session_state:
                         session_state.vad.reset()
 
-                        min_speech_bytes = int(Config.BYTES_PER_SECOND * 0.3)
-                        if len(session_state.audio_buffer) >= min_speech_bytes:
-                            process_bytes = bytes(session_state.audio_buffer)
-                            session_state.audio_buffer.clear()
+                        final_min_bytes = int(bytes_per_second * 0.3)
+                        if session_state.audio_len >= final_min_bytes:
+                            process_bytes = session_state.take_audio()
+                            audio_hash = session_state.audio_hasher.intdigest()
+                            session_state.audio_hasher = make_audio_hasher()
 
                             try:
-                                for response in self._process_audio(session_state, process_bytes, True):
+                                for response in self._process_audio(session_state, process_bytes, True,
+                                                                    audio_hash=audio_hash):
                                     yield response
-                            except Exception as proc_err:
+                            except _STAGE_ERRORS as proc_err:
                                 DebugLogger.log("END_PROCESS_ERROR", f"Final processing failed: {proc_err}")
                         else:
-                            session_state.audio_buffer.clear()
+                            session_state.audio_len = 0
+                            session_state.audio_hasher = make_audio_hasher()
 
-                    if current_session_id:
-                        with self.lock:
-                            self.sessions.pop(current_session_id, None)
+                    if current_session_id and (
+                            session_state is None
+                            or session_state._stream_token is stream_token):
+                        self._pop_session(current_session_id)
 
                     DebugLogger.log("SESSION_END", "Session ended", {
                         "session": current_session_id[:8] if current_session_id else "unknown",
@@ -223,46 +310,140 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
             )
 
         finally:
-            if current_session_id:
-                with self.lock:
-                    self.sessions.pop(current_session_id, None)
+            # 이 스트림이 여전히 세션을 소유할 때만 정리한다. 인계된 세션을
+            # 여기서 pop/release하면 새 스트림의 세션이 레지스트리에서 사라지고,
+            # 반납된 VAD가 풀을 거쳐 다른 세션에 대여되어 가변 상태가 공유된다.
+            if session_state is not None and session_state._stream_token is stream_token:
+                if current_session_id:
+                    self._pop_session(current_session_id)
+                session_state.release_vad()
             DebugLogger.log("STREAM", "Stream closed")
 
-    def _process_audio(self, state: SessionState, audio_bytes: bytes, is_final: bool):
+    @staticmethod
+    def _get_speaker_proto(state: SessionState):
+        """세션의 SpeakerInfo proto 캐시 반환 (최초 1회만 구성)
+
+        SpeakerInfo는 세션 중 불변 - 응답마다 재구성하지 않고 재사용한다.
+        (proto 필드 대입은 CopyFrom이므로 공유해도 안전)
+        """
+        proto = state._speaker_proto
+        if proto is None:
+            proto = state._speaker_proto = conversation_pb2.SpeakerInfo(
+                participant_id=state.speaker.participant_id,
+                nickname=state.speaker.nickname,
+                profile_img=state.speaker.profile_img,
+                source_language=state.speaker.source_language
+            )
+        return proto
+
+    def _partial_transcript(self, state: SessionState):
+        """누적 중인 버퍼를 전사해 미확정(is_partial) transcript 응답 생성
+
+        번역/TTS는 붙이지 않는다. sentence_end/buffer_full 시점의 최종
+        파이프라인이 is_final=True 결과로 정정하므로 캐시/코얼레싱도 거치지
+        않고 직접 전사한다 (버퍼가 매번 자라 해시가 항상 달라짐).
+        """
+        audio_bytes = state.peek_audio()
+        source_lang = state.speaker.source_language
+
+        audio_arr, buf = convert_int16_pooled(audio_bytes)
+        try:
+            partial_text, confidence = self.models.transcribe(audio_arr, source_lang)
+        finally:
+            release_buffer(buf)
+
+        if not partial_text:
+            return None
+
+        return conversation_pb2.ChatResponse(
+            session_id=state.session_id,
+            room_id=state.room_id,
+            transcript=conversation_pb2.TranscriptResult(
+                id=state.next_transcript_id(),
+                speaker=self._get_speaker_proto(state),
+                original_text=partial_text,
+                original_language=source_lang,
+                is_partial=True,
+                is_final=False,
+                timestamp_ms=int(time.time() * 1000),
+                confidence=confidence
+            )
+        )
+
+    @staticmethod
+    def _bare_transcript(state: SessionState, speaker_proto, original_text: str,
+                         source_lang: str, confidence: float):
+        """번역/TTS 없이 원문만 담은 transcript 응답 (filler/초단문 스킵 경로)
+
+        스킵 경로에서는 타겟 언어 조회도 생략한다 (translations는 빈 repeated).
+        """
+        return conversation_pb2.ChatResponse(
+            session_id=state.session_id,
+            room_id=state.room_id,
+            transcript=conversation_pb2.TranscriptResult(
+                id=state.next_transcript_id(),
+                speaker=speaker_proto,
+                original_text=original_text,
+                original_language=source_lang,
+                is_partial=False,
+                is_final=True,
+                timestamp_ms=int(time.time() * 1000),
+                confidence=confidence
+            )
+        )
+
+    def _process_audio(self, state: SessionState, audio_bytes: bytes, is_final: bool,
+                       audio_hash: int = None):
         """오디오 처리 파이프라인 (상세 디버깅 포함)"""
 
-        pipeline_start = time.time()
-        audio_duration = len(audio_bytes) / Config.BYTES_PER_SECOND
+        debug = DebugLogger.enabled()
+        pipeline_start = _now()
 
-        DebugLogger.log("PIPELINE_START", f"Starting audio pipeline", {
-            "bytes": len(audio_bytes),
-            "duration_sec": f"{audio_duration:.2f}",
-            "is_final": is_final
-        })
+        if debug:
+            audio_duration = len(audio_bytes) / Config.BYTES_PER_SECOND
+            DebugLogger.log("PIPELINE_START", f"Starting audio pipeline", {
+                "bytes": len(audio_bytes),
+                "duration_sec": f"{audio_duration:.2f}",
+                "is_final": is_final
+            })
 
         state.chunks_processed += 1
         if is_final:
             state.sentences_completed += 1
 
         # ===== STEP 1: STT (with Room Cache) =====
-        stt_start = time.time()
+        stt_start = _now()
         source_lang = state.speaker.source_language
 
+        speaker_proto = self._get_speaker_proto(state)
+
         def do_transcribe(audio_data):
-            audio_arr = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-            return self.models.transcribe(audio_arr, source_lang)
+            # int16 → float32 변환을 풀 버퍼 위에서 단일 패스로 수행 (호출마다 할당 없음)
+            audio_arr, buf = convert_int16_pooled(audio_data)
+            try:
+                return self.models.transcribe(audio_arr, source_lang)
+            finally:
+                release_buffer(buf)
+
+        def run_stt(data, data_hash):
+            return self.models.room_cache.get_or_create_stt(
+                room_id=state.room_id,
+                speaker_id=state.speaker.participant_id,
+                audio_bytes=data,
+                transcribe_fn=do_transcribe,
+                audio_hash=data_hash
+            )
 
-        original_text, confidence, stt_cached = self.models.room_cache.get_or_create_stt(
-            room_id=state.room_id,
-            speaker_id=state.speaker.participant_id,
-            audio_bytes=audio_bytes,
-            transcribe_fn=do_transcribe
+        # 같은 화자의 요청이 처리 중이면 최신 오디오만 처리 (coalescing)
+        original_text, confidence, stt_cached = self.stt_coalescer.submit(
+            (state.room_id, state.speaker.participant_id),
+            audio_bytes, audio_hash, run_stt
         )
 
-        stt_latency = (time.time() - stt_start) * 1000
+        stt_latency = (_now() - stt_start) // 1_000_000
         state.total_stt_latency_ms += stt_latency
 
-        if stt_cached:
+        if stt_cached and debug:
             DebugLogger.log("CACHE_STT", f"Using cached STT result", {"text_preview": original_text[:30] if original_text else ""})
 
         if not original_text:
@@ -270,77 +451,45 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
             return
 
         # Filler word check
-        is_filler = original_text.lower().strip() in Config.FILLER_WORDS or \
-                    original_text.strip() in Config.FILLER_WORDS
-        if is_filler:
+        if original_text.strip().casefold() in _FILLER_FSET:
             DebugLogger.log("FILLER", f"Detected filler word, skipping translation/TTS")
-            transcript_id = str(uuid.uuid4())[:8]
-            yield conversation_pb2.ChatResponse(
-                session_id=state.session_id,
-                room_id=state.room_id,
-                transcript=conversation_pb2.TranscriptResult(
-                    id=transcript_id,
-                    speaker=conversation_pb2.SpeakerInfo(
-                        participant_id=state.speaker.participant_id,
-                        nickname=state.speaker.nickname,
-                        profile_img=state.speaker.profile_img,
-                        source_language=source_lang
-                    ),
-                    original_text=original_text,
-                    original_language=source_lang,
-                    translations=[],
-                    is_partial=False,
-                    is_final=True,
-                    timestamp_ms=int(time.time() * 1000),
-                    confidence=confidence
-                )
-            )
+            yield self._bare_transcript(state, speaker_proto, original_text,
+                                        source_lang, confidence)
             return
 
-        transcript_id = str(uuid.uuid4())[:8]
+        if len(original_text.strip()) <= 1:
+            DebugLogger.log("TRANS_SKIP", "Text too short, skipping translation")
+            yield self._bare_transcript(state, speaker_proto, original_text,
+                                        source_lang, confidence)
+            return
+
+        transcript_id = state.next_transcript_id()
 
         # ===== STEP 2: Translation =====
         target_languages = state.get_target_languages()
         translations = []
 
-        if len(original_text.strip()) <= 1:
-            DebugLogger.log("TRANS_SKIP", "Text too short, skipping translation")
-            yield conversation_pb2.ChatResponse(
-                session_id=state.session_id,
-                room_id=state.room_id,
-                transcript=conversation_pb2.TranscriptResult(
-                    id=transcript_id,
-                    speaker=conversation_pb2.SpeakerInfo(
-                        participant_id=state.speaker.participant_id,
-                        nickname=state.speaker.nickname,
-                        profile_img=state.speaker.profile_img,
-                        source_language=source_lang
-                    ),
-                    original_text=original_text,
-                    original_language=source_lang,
-                    translations=[],
-                    is_partial=False,
-                    is_final=True,
-                    timestamp_ms=int(time.time() * 1000),
-                    confidence=confidence
-                )
-            )
-            return
-
-        trans_start = time.time()
-        for target_lang in target_languages:
-            def do_translate(text, src, tgt):
-                return self.models.translate(text, src, tgt)
+        trans_start = _now()
 
+        def translate_one(target_lang):
             translated_text, trans_cached = self.models.room_cache.get_or_create_translation(
                 room_id=state.room_id,
                 text=original_text,
                 source_lang=source_lang,
                 target_lang=target_lang,
-                translate_fn=do_translate
+                translate_fn=self.models.translate
             )
+            return target_lang, translated_text, trans_cached
 
-            if trans_cached:
+        # 타겟 언어들을 동시에 제출 - 캐시 미스들은 Qwen 마이크로 배처에서
+        # generate 1회로 묶이고, AWS 백엔드에서는 RTT가 겹친다
+        if len(target_languages) > 1:
+            results = RoomProcessor.get_trans_executor().map(translate_one, target_languages)
+        else:
+            results = map(translate_one, target_languages)
+
+        for target_lang, translated_text, trans_cached in results:
+            if trans_cached and debug:
                 DebugLogger.log("CACHE_TRANS", f"Using cached translation", {"target": target_lang})
 
             if translated_text:
@@ -352,26 +501,48 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                         target_participant_ids=target_participants
                     )
                 )
-        trans_latency = (time.time() - trans_start) * 1000
+        trans_latency = (_now() - trans_start) // 1_000_000
         state.total_translation_latency_ms += trans_latency
 
+        # ===== STEP 3: TTS 사전 제출 =====
+        # transcript 직렬화/전송과 Polly 합성이 겹치도록 yield 전에 제출
+        tts_start = _now()
+
+        def synthesize_one(translation):
+            translated_text = translation.translated_text
+
+            if len(translated_text.strip()) < Config.MIN_TTS_TEXT_LENGTH:
+                return translation, None, 0, False
+
+            if translated_text.strip().casefold() in _FILLER_FSET:
+                return translation, None, 0, False
+
+            audio_data, duration_ms, tts_cached = self.models.room_cache.get_or_create_tts(
+                room_id=state.room_id,
+                text=translated_text,
+                target_lang=translation.target_language,
+                synthesize_fn=self.models.synthesize_speech
+            )
+            return translation, audio_data, duration_ms, tts_cached
+
+        tts_futures = [
+            RoomProcessor.get_tts_executor().submit(synthesize_one, translation)
+            for translation in translations
+        ]
+
         # Send Transcript
-        DebugLogger.log("TRANSCRIPT_SEND", f"Sending transcript", {
-            "text_len": len(original_text),
-            "translations": len(translations)
-        })
+        if debug:
+            DebugLogger.log("TRANSCRIPT_SEND", f"Sending transcript", {
+                "text_len": len(original_text),
+                "translations": len(translations)
+            })
 
         yield conversation_pb2.ChatResponse(
             session_id=state.session_id,
             room_id=state.room_id,
             transcript=conversation_pb2.TranscriptResult(
                 id=transcript_id,
-                speaker=conversation_pb2.SpeakerInfo(
-                    participant_id=state.speaker.participant_id,
-                    nickname=state.speaker.nickname,
-                    profile_img=state.speaker.profile_img,
-                    source_language=source_lang
-                ),
+                speaker=speaker_proto,
                 original_text=original_text,
                 original_language=source_lang,
                 translations=translations,
@@ -382,39 +553,22 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
             )
         )
 
-        # ===== STEP 3: TTS (with Room Cache) =====
-        tts_start = time.time()
-        for translation in translations:
+        # TTS 결과 수거 (제출 순서 유지 - 기존 직렬 루프와 동일한 응답 순서)
+        for future in tts_futures:
+            translation, audio_data, duration_ms, tts_cached = future.result()
             target_lang = translation.target_language
-            translated_text = translation.translated_text
-
-            if len(translated_text.strip()) < Config.MIN_TTS_TEXT_LENGTH:
-                continue
 
-            if translated_text.lower().strip() in Config.FILLER_WORDS or \
-               translated_text.strip() in Config.FILLER_WORDS:
-                continue
-
-            def do_synthesize(text, lang):
-                return self.models.synthesize_speech(text, lang)
-
-            audio_data, duration_ms, tts_cached = self.models.room_cache.get_or_create_tts(
-                room_id=state.room_id,
-                text=translated_text,
-                target_lang=target_lang,
-                synthesize_fn=do_synthesize
-            )
-
-            if tts_cached:
+            if tts_cached and debug:
                 DebugLogger.log("CACHE_TTS", f"Using cached TTS", {"target": target_lang, "audio_bytes": len(audio_data) if audio_data else 0})
 
             if audio_data:
-                DebugLogger.log("TTS_SEND", f"Sending TTS audio", {
-                    "target_lang": target_lang,
-                    "audio_bytes": len(audio_data),
-                    "duration_ms": duration_ms,
-                    "cached": tts_cached
-                })
+                if debug:
+                    DebugLogger.log("TTS_SEND", f"Sending TTS audio", {
+                        "target_lang": target_lang,
+                        "audio_bytes": len(audio_data),
+                        "duration_ms": duration_ms,
+                        "cached": tts_cached
+                    })
 
                 yield conversation_pb2.ChatResponse(
                     session_id=state.session_id,
@@ -422,40 +576,48 @@ class ConversationServicer(conversation_pb2_grpc.ConversationServiceServicer):
                     audio=conversation_pb2.AudioResult(
                         transcript_id=transcript_id,
                         target_language=target_lang,
-                        target_participant_ids=list(translation.target_participant_ids),
+                        # 직전에 이 함수에서 캐시된 tuple로 채운 필드 - proto 컨테이너를
+                        # list로 복사해 되돌리지 않고 같은 tuple을 그대로 넘긴다
+                        target_participant_ids=state.get_participants_by_target_language(target_lang),
                         audio_data=audio_data,
-                        format="mp3",
-                        sample_rate=24000,
+                        # TTS 레이어가 실제로 합성한 포맷/샘플레이트를 그대로 싣는다
+                        # (pcm 모드에서 mp3/24000을 하드코딩하면 클라이언트가 잘못 디코드)
+                        format=Config.TTS_OUTPUT_FORMAT,
+                        sample_rate=Config.TTS_SAMPLE_RATE,
                         duration_ms=duration_ms,
                         speaker_participant_id=state.speaker.participant_id
                     )
                 )
 
-        tts_latency = (time.time() - tts_start) * 1000
+        tts_latency = (_now() - tts_start) // 1_000_000
         state.total_tts_latency_ms += tts_latency
 
         # Pipeline summary
-        total_latency = (time.time() - pipeline_start) * 1000
-        DebugLogger.pipeline_complete(total_latency, {
-            "stt_ms": f"{stt_latency:.0f}",
-            "trans_ms": f"{trans_latency:.0f}",
-            "tts_ms": f"{tts_latency:.0f}",
-        })
+        if debug:
+            total_latency = (_now() - pipeline_start) // 1_000_000
+            DebugLogger.pipeline_complete(total_latency, {
+                "stt_ms": stt_latency,
+                "trans_ms": trans_latency,
+                "tts_ms": tts_latency,
+            })
 
     def UpdateParticipantSettings(self, request, context):
         """참가자 설정 업데이트"""
         room_id = request.room_id
         participant_id = request.participant_id
 
+        # 역색인으로 해당 room의 세션만 조회 (전체 세션 스캔 없음)
+        with self._room_lock:
+            session_ids = list(self._room_sessions.get(room_id, ()))
+
         updated = False
-        with self.lock:
-            for session in self.sessions.values():
-                if session.room_id == room_id and participant_id in session.participants:
-                    p = session.participants[participant_id]
-                    p.target_language = request.target_language
-                    p.translation_enabled = request.translation_enabled
-                    session.determine_primary_strategy()
-                    updated = True
+        for session_id in session_ids:
+            session = self._get_session(session_id)
+            if session and session.update_participant_settings(
+                participant_id, request.target_language, request.translation_enabled
+            ):
+                session.determine_primary_strategy()
+                updated = True
 
         return conversation_pb2.ParticipantSettingsResponse(
             success=updated,
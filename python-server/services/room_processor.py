@@ -4,33 +4,63 @@ Room당 하나의 프로세서로 효율적인 리소스 사용
 """
 
 import time
-import uuid
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Tuple, Optional, Set
+from functools import partial
+from typing import Dict, Iterable, List, Tuple, Optional
 from dataclasses import dataclass
 import threading
 
 from config.settings import Config
 from utils.logger import DebugLogger
+from utils.float32_pool import convert_int16_pooled, release_buffer
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from generated import conversation_pb2
 
+# 청크마다 조회되는 Config 상수를 모듈 상수로 (LOAD_ATTR 체인 제거)
+_BYTES_PER_SECOND = Config.BYTES_PER_SECOND
+_MIN_TTS_LEN = Config.MIN_TTS_TEXT_LENGTH
 
-@dataclass
+# AudioResult에 싣는 실제 합성 출력 파라미터 (TTS 레이어와 동일한 knob에서 유도)
+_TTS_FORMAT = Config.TTS_OUTPUT_FORMAT
+_TTS_SAMPLE_RATE = Config.TTS_SAMPLE_RATE
+
+# filler 검사용: casefold된 frozenset으로 1회 조회 (lower/원문 2회 조회 대체)
+_FILLER_FSET = frozenset(w.strip().casefold() for w in Config.FILLER_WORDS)
+
+
+def _speaker_proto_for(state) -> "conversation_pb2.SpeakerInfo":
+    """세션의 SpeakerInfo proto 캐시 반환 (servicer와 같은 캐시 슬롯 사용)
+
+    kwargs 생성은 필드별 descriptor 조회를 동반하므로 세션 중 불변인
+    SpeakerInfo는 최초 1회만 만들고 재사용한다 (대입은 CopyFrom이라 안전).
+    """
+    proto = state._speaker_proto
+    if proto is None:
+        proto = state._speaker_proto = conversation_pb2.SpeakerInfo(
+            participant_id=state.speaker.participant_id,
+            nickname=state.speaker.nickname,
+            profile_img=state.speaker.profile_img,
+            source_language=state.speaker.source_language
+        )
+    return proto
+
+
+@dataclass(slots=True)
 class TranslationResult:
-    """번역 결과"""
+    """번역 결과 (청크마다 타겟 언어 수만큼 생성되므로 __dict__ 없이)"""
     target_lang: str
     translated_text: str
     target_participant_ids: List[str]
     cached: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSResult:
-    """TTS 결과"""
+    """TTS 결과 (청크마다 타겟 언어 수만큼 생성되므로 __dict__ 없이)"""
     target_lang: str
     audio_data: bytes
     duration_ms: int
@@ -49,50 +79,151 @@ class RoomProcessor:
     - 효율적인 캐시 활용
     """
 
-    # 클래스 레벨 ThreadPoolExecutor (모든 Room에서 공유)
-    _executor: Optional[ThreadPoolExecutor] = None
+    # 스테이지별 클래스 레벨 ThreadPoolExecutor (모든 Room에서 공유)
+    # 번역(모델/CPU 바운드)과 TTS(네트워크 I/O 바운드)는 지연/자원 프로파일이
+    # 달라 풀을 분리 - 한 스테이지의 버스트가 다른 스테이지를 큐에서
+    # 기다리게 하는 head-of-line 블로킹을 제거한다
+    _trans_executor: Optional[ThreadPoolExecutor] = None
+    _tts_executor: Optional[ThreadPoolExecutor] = None
     _executor_lock = threading.Lock()
 
+    @staticmethod
+    def _prime_workers(executor: ThreadPoolExecutor, n_workers: int):
+        """worker 스레드를 미리 전부 기동 (첫 버스트의 스레드 생성 지연 제거)
+
+        ThreadPoolExecutor는 submit 시점에 스레드를 lazy 생성하므로, barrier에
+        블록되는 작업을 worker 수만큼 제출해 전원을 지금 띄워 둔다.
+        """
+        barrier = threading.Barrier(n_workers + 1)
+        for _ in range(n_workers):
+            executor.submit(barrier.wait)
+        try:
+            barrier.wait(timeout=5)
+        except threading.BrokenBarrierError:
+            pass  # 기동 실패해도 lazy 생성으로 동작은 유지
+
     @classmethod
-    def get_executor(cls) -> ThreadPoolExecutor:
-        """공유 ThreadPoolExecutor 반환"""
-        if cls._executor is None:
+    def get_trans_executor(cls) -> ThreadPoolExecutor:
+        """번역 전용 공유 ThreadPoolExecutor 반환"""
+        if cls._trans_executor is None:
             with cls._executor_lock:
-                if cls._executor is None:
-                    # 번역 + TTS 병렬 처리를 위한 worker 수
-                    max_workers = Config.PARALLEL_WORKERS if hasattr(Config, 'PARALLEL_WORKERS') else 8
-                    cls._executor = ThreadPoolExecutor(max_workers=max_workers)
-                    DebugLogger.log("PROCESSOR", f"ThreadPoolExecutor created with {max_workers} workers")
-        return cls._executor
+                if cls._trans_executor is None:
+                    executor = ThreadPoolExecutor(max_workers=Config.TRANS_WORKERS)
+                    cls._prime_workers(executor, Config.TRANS_WORKERS)
+                    cls._trans_executor = executor
+                    DebugLogger.log("PROCESSOR", f"Translation executor created with {Config.TRANS_WORKERS} workers")
+        return cls._trans_executor
+
+    @classmethod
+    def get_tts_executor(cls) -> ThreadPoolExecutor:
+        """TTS 전용 공유 ThreadPoolExecutor 반환"""
+        if cls._tts_executor is None:
+            with cls._executor_lock:
+                if cls._tts_executor is None:
+                    executor = ThreadPoolExecutor(max_workers=Config.TTS_WORKERS)
+                    cls._prime_workers(executor, Config.TTS_WORKERS)
+                    cls._tts_executor = executor
+                    DebugLogger.log("PROCESSOR", f"TTS executor created with {Config.TTS_WORKERS} workers")
+        return cls._tts_executor
 
     def __init__(self, room_id: str, model_manager):
         self.room_id = room_id
         self.models = model_manager
-        self.target_languages: Set[str] = set()
-        self._lock = threading.Lock()
+        # copy-on-write: 변경 시에만 락을 잡고 새 frozenset으로 교체,
+        # 읽기(청크마다 호출)는 락/복사 없는 attribute load 한 번
+        self._target_languages: frozenset = frozenset()
+        self._mut_lock = threading.Lock()
 
         DebugLogger.log("ROOM_PROCESSOR", f"RoomProcessor created for room {room_id}")
 
     def add_target_language(self, lang: str):
         """타겟 언어 추가"""
-        with self._lock:
-            self.target_languages.add(lang)
+        with self._mut_lock:
+            self._target_languages = self._target_languages | {lang}
 
     def remove_target_language(self, lang: str):
         """타겟 언어 제거"""
-        with self._lock:
-            self.target_languages.discard(lang)
+        with self._mut_lock:
+            self._target_languages = self._target_languages - {lang}
+
+    def get_target_languages(self) -> frozenset:
+        """현재 타겟 언어 집합 (불변 - 호출자는 수정하지 않는다)"""
+        return self._target_languages
+
+    def shutdown(self):
+        """프로세서 폐기 (executor는 전체 room 공유라 여기서 닫지 않는다)"""
+        with self._mut_lock:
+            self._target_languages = frozenset()
+
+    def _do_transcribe(self, audio_data: bytes, language: str):
+        """STT 실행 (풀 버퍼 위에서 int16 → float32 변환)"""
+        audio_arr, buf = convert_int16_pooled(audio_data)
+        try:
+            return self.models.transcribe(audio_arr, language)
+        finally:
+            release_buffer(buf)
+
+    @staticmethod
+    def _needs_tts(text: str) -> bool:
+        """TTS 합성 대상 여부 (최소 길이 + filler 제외)"""
+        s = text.strip()
+        return len(s) >= _MIN_TTS_LEN and s.casefold() not in _FILLER_FSET
+
+    def _translate_single(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        get_participants_fn
+    ) -> Optional[TranslationResult]:
+        """단일 언어 번역 (executor worker에서 실행)"""
+        try:
+            translated_text, cached = self.models.room_cache.get_or_create_translation(
+                room_id=self.room_id,
+                text=text,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                translate_fn=self.models.translate
+            )
 
-    def get_target_languages(self) -> List[str]:
-        """현재 타겟 언어 목록"""
-        with self._lock:
-            return list(self.target_languages)
+            if translated_text:
+                return TranslationResult(
+                    target_lang=target_lang,
+                    translated_text=translated_text,
+                    target_participant_ids=get_participants_fn(target_lang),
+                    cached=cached
+                )
+        except Exception as e:
+            DebugLogger.log("TRANS_ERROR", f"Translation failed for {target_lang}: {e}")
+        return None
+
+    def _synthesize_single(self, translation: TranslationResult) -> Optional[TTSResult]:
+        """단일 TTS 합성 (executor worker에서 실행)"""
+        try:
+            audio_data, duration_ms, cached = self.models.room_cache.get_or_create_tts(
+                room_id=self.room_id,
+                text=translation.translated_text,
+                target_lang=translation.target_lang,
+                synthesize_fn=self.models.synthesize_speech
+            )
+
+            if audio_data:
+                return TTSResult(
+                    target_lang=translation.target_lang,
+                    audio_data=audio_data,
+                    duration_ms=duration_ms,
+                    target_participant_ids=translation.target_participant_ids,
+                    cached=cached
+                )
+        except Exception as e:
+            DebugLogger.log("TTS_ERROR", f"TTS failed for {translation.target_lang}: {e}")
+        return None
 
     def translate_parallel(
         self,
         text: str,
         source_lang: str,
-        target_languages: List[str],
+        target_languages: Iterable[str],
         get_participants_fn
     ) -> List[TranslationResult]:
         """
@@ -101,7 +232,7 @@ class RoomProcessor:
         Args:
             text: 원본 텍스트
             source_lang: 원본 언어
-            target_languages: 타겟 언어 목록
+            target_languages: 타겟 언어 목록/집합 (복사 없이 순회만 한다)
             get_participants_fn: 타겟 언어별 참가자 ID 반환 함수
 
         Returns:
@@ -112,47 +243,33 @@ class RoomProcessor:
 
         start_time = time.time()
         results: List[TranslationResult] = []
-        executor = self.get_executor()
-
-        def translate_single(target_lang: str) -> Optional[TranslationResult]:
-            """단일 언어 번역"""
-            try:
-                def do_translate(txt, src, tgt):
-                    return self.models.translate(txt, src, tgt)
-
-                translated_text, cached = self.models.room_cache.get_or_create_translation(
-                    room_id=self.room_id,
-                    text=text,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    translate_fn=do_translate
-                )
-
-                if translated_text:
-                    participants = get_participants_fn(target_lang)
-                    return TranslationResult(
-                        target_lang=target_lang,
-                        translated_text=translated_text,
-                        target_participant_ids=participants,
-                        cached=cached
-                    )
-            except Exception as e:
-                DebugLogger.log("TRANS_ERROR", f"Translation failed for {target_lang}: {e}")
-            return None
 
-        # 병렬 번역 실행
-        futures = {executor.submit(translate_single, lang): lang for lang in target_languages}
-
-        for future in as_completed(futures):
-            lang = futures[future]
-            try:
-                result = future.result()
-                if result:
-                    results.append(result)
-                    if result.cached:
-                        DebugLogger.log("CACHE_TRANS", f"Cached: {lang}")
-            except Exception as e:
-                DebugLogger.log("TRANS_ERROR", f"Future failed for {lang}: {e}")
+        if len(target_languages) == 1:
+            # 단일 타겟이면 executor 왕복 없이 인라인 실행 (1:1 대화의 공통 경로)
+            result = self._translate_single(text, source_lang, next(iter(target_languages)),
+                                            get_participants_fn)
+            if result:
+                results.append(result)
+                if result.cached:
+                    DebugLogger.log("CACHE_TRANS", f"Cached: {result.target_lang}")
+        else:
+            # 병렬 번역 실행
+            executor = self.get_trans_executor()
+            futures = {
+                executor.submit(self._translate_single, text, source_lang, lang, get_participants_fn): lang
+                for lang in target_languages
+            }
+
+            for future in as_completed(futures):
+                lang = futures[future]
+                try:
+                    result = future.result()
+                    if result:
+                        results.append(result)
+                        if result.cached:
+                            DebugLogger.log("CACHE_TRANS", f"Cached: {lang}")
+                except Exception as e:
+                    DebugLogger.log("TRANS_ERROR", f"Future failed for {lang}: {e}")
 
         latency_ms = (time.time() - start_time) * 1000
         DebugLogger.log("TRANS_PARALLEL", f"Parallel translation complete", {
@@ -183,57 +300,35 @@ class RoomProcessor:
 
         start_time = time.time()
         results: List[TTSResult] = []
-        executor = self.get_executor()
 
         # TTS가 필요한 번역만 필터링
-        tts_candidates = [
-            t for t in translations
-            if len(t.translated_text.strip()) >= Config.MIN_TTS_TEXT_LENGTH
-            and t.translated_text.lower().strip() not in Config.FILLER_WORDS
-            and t.translated_text.strip() not in Config.FILLER_WORDS
-        ]
+        tts_candidates = [t for t in translations if self._needs_tts(t.translated_text)]
 
         if not tts_candidates:
             return []
 
-        def synthesize_single(translation: TranslationResult) -> Optional[TTSResult]:
-            """단일 TTS 합성"""
-            try:
-                def do_synthesize(txt, lang):
-                    return self.models.synthesize_speech(txt, lang)
-
-                audio_data, duration_ms, cached = self.models.room_cache.get_or_create_tts(
-                    room_id=self.room_id,
-                    text=translation.translated_text,
-                    target_lang=translation.target_lang,
-                    synthesize_fn=do_synthesize
-                )
-
-                if audio_data:
-                    return TTSResult(
-                        target_lang=translation.target_lang,
-                        audio_data=audio_data,
-                        duration_ms=duration_ms,
-                        target_participant_ids=translation.target_participant_ids,
-                        cached=cached
-                    )
-            except Exception as e:
-                DebugLogger.log("TTS_ERROR", f"TTS failed for {translation.target_lang}: {e}")
-            return None
-
-        # 병렬 TTS 실행
-        futures = {executor.submit(synthesize_single, t): t for t in tts_candidates}
-
-        for future in as_completed(futures):
-            translation = futures[future]
-            try:
-                result = future.result()
-                if result:
-                    results.append(result)
-                    if result.cached:
-                        DebugLogger.log("CACHE_TTS", f"Cached: {result.target_lang}")
-            except Exception as e:
-                DebugLogger.log("TTS_ERROR", f"Future failed for {translation.target_lang}: {e}")
+        if len(tts_candidates) == 1:
+            # 단일 후보면 executor 왕복 없이 인라인 실행
+            result = self._synthesize_single(tts_candidates[0])
+            if result:
+                results.append(result)
+                if result.cached:
+                    DebugLogger.log("CACHE_TTS", f"Cached: {result.target_lang}")
+        else:
+            # 병렬 TTS 실행
+            executor = self.get_tts_executor()
+            futures = {executor.submit(self._synthesize_single, t): t for t in tts_candidates}
+
+            for future in as_completed(futures):
+                translation = futures[future]
+                try:
+                    result = future.result()
+                    if result:
+                        results.append(result)
+                        if result.cached:
+                            DebugLogger.log("CACHE_TTS", f"Cached: {result.target_lang}")
+                except Exception as e:
+                    DebugLogger.log("TTS_ERROR", f"Future failed for {translation.target_lang}: {e}")
 
         latency_ms = (time.time() - start_time) * 1000
         DebugLogger.log("TTS_PARALLEL", f"Parallel TTS complete", {
@@ -255,10 +350,8 @@ class RoomProcessor:
 
         STT → 병렬 번역 → 병렬 TTS
         """
-        import numpy as np
-
         pipeline_start = time.time()
-        audio_duration = len(audio_bytes) / Config.BYTES_PER_SECOND
+        audio_duration = len(audio_bytes) / _BYTES_PER_SECOND
 
         DebugLogger.log("PIPELINE_START", f"Starting parallel pipeline", {
             "bytes": len(audio_bytes),
@@ -274,15 +367,11 @@ class RoomProcessor:
         stt_start = time.time()
         source_lang = state.speaker.source_language
 
-        def do_transcribe(audio_data):
-            audio_arr = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-            return self.models.transcribe(audio_arr, source_lang)
-
         original_text, confidence, stt_cached = self.models.room_cache.get_or_create_stt(
             room_id=state.room_id,
             speaker_id=state.speaker.participant_id,
             audio_bytes=audio_bytes,
-            transcribe_fn=do_transcribe
+            transcribe_fn=partial(self._do_transcribe, language=source_lang)
         )
 
         stt_latency = (time.time() - stt_start) * 1000
@@ -292,44 +381,92 @@ class RoomProcessor:
             DebugLogger.log("PIPELINE_SKIP", "No text from STT")
             return
 
+        # 파이프라인당 wall-clock 1회 (transcript와 모든 AudioResult가 공유)
+        now_ms = int(time.time() * 1000)
+
         # Filler word check
-        is_filler = original_text.lower().strip() in Config.FILLER_WORDS or \
-                    original_text.strip() in Config.FILLER_WORDS
-        if is_filler:
-            transcript_id = str(uuid.uuid4())[:8]
+        if original_text.strip().casefold() in _FILLER_FSET:
             yield conversation_pb2.ChatResponse(
                 session_id=state.session_id,
                 room_id=state.room_id,
                 transcript=conversation_pb2.TranscriptResult(
-                    id=transcript_id,
-                    speaker=conversation_pb2.SpeakerInfo(
-                        participant_id=state.speaker.participant_id,
-                        nickname=state.speaker.nickname,
-                        profile_img=state.speaker.profile_img,
-                        source_language=source_lang
-                    ),
+                    id=state.next_transcript_id(),
+                    speaker=_speaker_proto_for(state),
                     original_text=original_text,
                     original_language=source_lang,
                     translations=[],
                     is_partial=False,
                     is_final=True,
-                    timestamp_ms=int(time.time() * 1000),
+                    timestamp_ms=now_ms,
                     confidence=confidence
                 )
             )
             return
 
-        transcript_id = str(uuid.uuid4())[:8]
+        transcript_id = state.next_transcript_id()
         target_languages = state.get_target_languages()
 
-        # ===== STEP 2: Parallel Translation =====
+        if not target_languages:
+            # 혼자 있는 방 - 번역/TTS 없이 transcript만 전송하고 종료
+            yield conversation_pb2.ChatResponse(
+                session_id=state.session_id,
+                room_id=state.room_id,
+                transcript=conversation_pb2.TranscriptResult(
+                    id=transcript_id,
+                    speaker=_speaker_proto_for(state),
+                    original_text=original_text,
+                    original_language=source_lang,
+                    is_partial=not is_final,
+                    is_final=is_final,
+                    timestamp_ms=now_ms,
+                    confidence=confidence
+                )
+            )
+            return
+
+        # ===== STEP 2: Parallel Translation (+ 완료 즉시 TTS 제출) =====
+        # 모든 번역이 끝나기를 기다렸다가 TTS를 시작하는 대신, 각 언어의
+        # 번역이 완료되는 순간 해당 언어의 TTS를 제출해 스테이지 2/3을 겹친다
+        # (전체 지연이 max(trans)+max(tts)에서 max(trans_i+tts_i) 쪽으로 줄어듦)
         trans_start = time.time()
-        translation_results = self.translate_parallel(
-            text=original_text,
-            source_lang=source_lang,
-            target_languages=list(target_languages),
-            get_participants_fn=state.get_participants_by_target_language
-        )
+        trans_executor = self.get_trans_executor()
+        tts_executor = self.get_tts_executor()
+
+        translation_results: List[TranslationResult] = []
+        tts_futures = []
+
+        if len(target_languages) == 1:
+            # 단일 타겟이면 executor 왕복 없이 인라인 번역 (TTS는 transcript
+            # 전송과 겹치도록 계속 executor에 제출)
+            result = self._translate_single(
+                original_text, source_lang, next(iter(target_languages)),
+                state.get_participants_by_target_language
+            )
+            if result is not None:
+                translation_results.append(result)
+                if self._needs_tts(result.translated_text):
+                    tts_futures.append(tts_executor.submit(self._synthesize_single, result))
+        else:
+            trans_futures = [
+                trans_executor.submit(
+                    self._translate_single, original_text, source_lang, lang,
+                    state.get_participants_by_target_language
+                )
+                for lang in target_languages
+            ]
+
+            for future in as_completed(trans_futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    DebugLogger.log("TRANS_ERROR", f"Future failed: {e}")
+                    continue
+                if result is None:
+                    continue
+                translation_results.append(result)
+                if self._needs_tts(result.translated_text):
+                    tts_futures.append(tts_executor.submit(self._synthesize_single, result))
+
         trans_latency = (time.time() - trans_start) * 1000
         state.total_translation_latency_ms += trans_latency
 
@@ -349,33 +486,32 @@ class RoomProcessor:
             room_id=state.room_id,
             transcript=conversation_pb2.TranscriptResult(
                 id=transcript_id,
-                speaker=conversation_pb2.SpeakerInfo(
-                    participant_id=state.speaker.participant_id,
-                    nickname=state.speaker.nickname,
-                    profile_img=state.speaker.profile_img,
-                    source_language=source_lang
-                ),
+                speaker=_speaker_proto_for(state),
                 original_text=original_text,
                 original_language=source_lang,
                 translations=translations,
                 is_partial=not is_final,
                 is_final=is_final,
-                timestamp_ms=int(time.time() * 1000),
+                timestamp_ms=now_ms,
                 confidence=confidence
             )
         )
 
-        # ===== STEP 3: Parallel TTS =====
+        # ===== STEP 3: TTS 결과 수거 (번역 중 이미 제출됨) =====
         tts_start = time.time()
-        tts_results = self.synthesize_parallel(
-            translations=translation_results,
-            speaker_participant_id=state.speaker.participant_id
-        )
-        tts_latency = (time.time() - tts_start) * 1000
-        state.total_tts_latency_ms += tts_latency
 
-        # Send TTS Audio
-        for tts_result in tts_results:
+        # Send TTS Audio - 완료되는 순서대로 즉시 전송
+        for future in as_completed(tts_futures):
+            try:
+                tts_result = future.result()
+            except Exception as e:
+                DebugLogger.log("TTS_ERROR", f"Future failed: {e}")
+                continue
+            if tts_result is None:
+                continue
+            if tts_result.cached:
+                DebugLogger.log("CACHE_TTS", f"Cached: {tts_result.target_lang}")
+
             yield conversation_pb2.ChatResponse(
                 session_id=state.session_id,
                 room_id=state.room_id,
@@ -384,13 +520,16 @@ class RoomProcessor:
                     target_language=tts_result.target_lang,
                     target_participant_ids=tts_result.target_participant_ids,
                     audio_data=tts_result.audio_data,
-                    format="mp3",
-                    sample_rate=24000,
+                    format=_TTS_FORMAT,
+                    sample_rate=_TTS_SAMPLE_RATE,
                     duration_ms=tts_result.duration_ms,
                     speaker_participant_id=state.speaker.participant_id
                 )
             )
 
+        tts_latency = (time.time() - tts_start) * 1000
+        state.total_tts_latency_ms += tts_latency
+
         # Pipeline summary
         total_latency = (time.time() - pipeline_start) * 1000
         DebugLogger.pipeline_complete(total_latency, {
@@ -402,19 +541,28 @@ class RoomProcessor:
 
 
 class RoomProcessorManager:
-    """Room별 RoomProcessor 관리"""
+    """Room별 RoomProcessor 관리 (LRU 상한 - remove 누락 시에도 무한 증식 방지)"""
 
     def __init__(self, model_manager):
         self.model_manager = model_manager
-        self.processors: Dict[str, RoomProcessor] = {}
+        self.processors: "OrderedDict[str, RoomProcessor]" = OrderedDict()
         self._lock = threading.Lock()
 
     def get_or_create(self, room_id: str) -> RoomProcessor:
-        """RoomProcessor 반환 (없으면 생성)"""
+        """RoomProcessor 반환 (없으면 생성, 접근 시 LRU 갱신)"""
         with self._lock:
-            if room_id not in self.processors:
-                self.processors[room_id] = RoomProcessor(room_id, self.model_manager)
-            return self.processors[room_id]
+            processor = self.processors.get(room_id)
+            if processor is None:
+                processor = RoomProcessor(room_id, self.model_manager)
+                self.processors[room_id] = processor
+                # 스트림이 비정상 종료해 remove()가 누락된 room을 LRU로 회수
+                while len(self.processors) > Config.MAX_ROOMS:
+                    old_id, old_proc = self.processors.popitem(last=False)
+                    old_proc.shutdown()
+                    DebugLogger.log("ROOM_PROCESSOR", f"Evicted stale processor for room {old_id}")
+            else:
+                self.processors.move_to_end(room_id)
+            return processor
 
     def remove(self, room_id: str):
         """RoomProcessor 제거"""
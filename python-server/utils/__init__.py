@@ -1,4 +1,5 @@
 """Utils module - Logging and utility functions"""
 from utils.logger import DebugLogger
+from utils.float32_pool import Float32Pool, convert_int16_pooled, release_buffer
 
-__all__ = ["DebugLogger"]
+__all__ = ["DebugLogger", "Float32Pool", "convert_int16_pooled", "release_buffer"]
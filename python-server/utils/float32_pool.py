@@ -0,0 +1,70 @@
+"""
+Float32 변환 버퍼 풀
+
+STT 직전의 int16 → float32 변환은 호출마다 수백 KB짜리 ndarray를 새로
+할당한다. 표준 용량(flush 상한 분량)의 버퍼를 LIFO로 재사용해 핫패스의
+할당/GC 압력을 없애고, 가장 최근 버퍼가 캐시에 남아 있는 상태로 돌아온다.
+"""
+
+import queue
+
+import numpy as np
+
+from config.settings import Config
+
+# 표준 버퍼 용량: flush 상한(SENTENCE_MAX_BYTES) 분량의 샘플 수
+_STANDARD_SAMPLES = Config.SENTENCE_MAX_BYTES // Config.BYTES_PER_SAMPLE
+
+# 풀 상한 (동시 STT worker 수보다 여유 있게)
+_POOL_MAX = 32
+
+
+class Float32Pool:
+    """표준 용량 float32 버퍼의 thread-safe LIFO 풀"""
+
+    def __init__(self, capacity: int = _STANDARD_SAMPLES, max_items: int = _POOL_MAX):
+        self._capacity = capacity
+        self._pool: queue.LifoQueue = queue.LifoQueue(max_items)
+
+    def acquire(self) -> np.ndarray:
+        """버퍼를 꺼내거나 (비어 있으면) 새로 할당 (내용 초기화 불필요)"""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return np.empty(self._capacity, dtype=np.float32)
+
+    def release(self, buf: np.ndarray):
+        """사용 끝난 버퍼 반납 (표준 용량만 풀에 유지, 상한 초과분은 GC)"""
+        if buf.size != self._capacity:
+            return
+        try:
+            self._pool.put_nowait(buf)
+        except queue.Full:
+            pass
+
+
+_POOL = Float32Pool()
+
+
+def convert_int16_pooled(audio_bytes: bytes):
+    """
+    int16 PCM bytes를 풀 버퍼 위의 float32 [-1, 1] 배열로 변환
+
+    Returns:
+        (audio_arr, buf): 변환 결과 view와 반납용 버퍼.
+        사용 후 release_buffer(buf)를 호출해야 한다 (try/finally 권장).
+        표준 용량을 넘는 입력은 풀을 거치지 않고 새로 할당한다 (buf=None).
+    """
+    src = np.frombuffer(audio_bytes, dtype=np.int16)
+    if src.size <= _STANDARD_SAMPLES:
+        buf = _POOL.acquire()
+        audio_arr = np.multiply(src, np.float32(1.0 / 32768.0), out=buf[:src.size])
+        return audio_arr, buf
+    # 비표준(초과) 크기는 fallback 일회성 할당
+    return np.multiply(src, np.float32(1.0 / 32768.0), dtype=np.float32), None
+
+
+def release_buffer(buf):
+    """convert_int16_pooled()가 돌려준 버퍼를 풀에 반납 (None 허용)"""
+    if buf is not None:
+        _POOL.release(buf)
@@ -2,32 +2,101 @@
 Debug Logger - Detailed timing and flow tracking
 """
 
+import os
+import sys
 import json
-from datetime import datetime
+import time
+import queue
+import logging
+import logging.handlers
+
+# Optional: Rust 기반 JSON 직렬화 (json 대비 5~10배, UTF-8 SIMD 처리)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# strftime은 locale/포맷 디스패치 비용이 커서 초 단위 접두사를 캐시하고
+# 밀리초만 메시지마다 포맷한다. (sec, "HH:MM:SS.") 튜플 하나로 묶어
+# 여러 스레드에서 읽어도 찢어진 값이 보이지 않게 한다.
+_ts_cache = (0, "")
+
+
+def _format_ts(t: float) -> str:
+    global _ts_cache
+    sec = int(t)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        lt = time.localtime(sec)
+        prefix = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}."
+        _ts_cache = (sec, prefix)
+    return f"{prefix}{int((t - sec) * 1000):03d}"
+
+
+class _LazyMessage:
+    """포맷/직렬화를 리스너 스레드로 미루는 로그 메시지
+
+    생산자(핫패스)는 이 객체의 참조만 큐에 넣고, strftime과 json.dumps는
+    QueueListener 스레드가 출력할 때 __str__에서 실행된다.
+    """
+    __slots__ = ("ts", "category", "message", "data")
+
+    def __init__(self, ts, category, message, data):
+        self.ts = ts
+        self.category = category
+        self.message = message
+        self.data = data
+
+    def __str__(self):
+        ts = _format_ts(self.ts)
+        if self.data:
+            if ORJSON_AVAILABLE:
+                data_str = orjson.dumps(self.data, default=str).decode()
+            else:
+                data_str = json.dumps(self.data, ensure_ascii=False, default=str)
+            return f"[{ts}] [{self.category}] {self.message} | {data_str}"
+        return f"[{ts}] [{self.category}] {self.message}"
+
+
+class _PassThroughQueueHandler(logging.handlers.QueueHandler):
+    """같은 프로세스 내 소비이므로 prepare의 사전 포맷을 생략 (지연 포맷 유지)"""
+
+    def prepare(self, record):
+        return record
 
 
 class DebugLogger:
     """상세 디버깅을 위한 로거 클래스"""
 
-    ENABLED = True  # 디버깅 활성화/비활성화
+    ENABLED = os.getenv("DEBUG_LOG", "1") == "1"  # 디버깅 활성화/비활성화
     VERBOSE = True  # 상세 로그 (오디오 바이트 등)
 
+    @staticmethod
+    def enabled(category: str = None) -> bool:
+        """
+        핫패스 로그 호출 전 가드용 boolean
+
+        log()도 ENABLED를 확인하지만, 호출 측에서 먼저 가드하면
+        인자 dict 구성과 f-string 포맷 비용 자체를 생략할 수 있다.
+        """
+        return DebugLogger.ENABLED
+
     @staticmethod
     def timestamp():
-        return datetime.now().strftime('%H:%M:%S.%f')[:-3]
+        return _format_ts(time.time())
 
     @staticmethod
     def log(category: str, message: str, data: dict = None):
         if not DebugLogger.ENABLED:
             return
 
-        ts = DebugLogger.timestamp()
-
-        if data and DebugLogger.VERBOSE:
-            data_str = json.dumps(data, ensure_ascii=False, default=str)
-            print(f"[{ts}] [{category}] {message} | {data_str}")
-        else:
-            print(f"[{ts}] [{category}] {message}")
+        # print()의 stdout 락/syscall 대신 빠른 enqueue만 수행 -
+        # 실제 포맷과 출력은 전용 리스너 스레드가 담당한다
+        _logger.debug(_LazyMessage(
+            time.time(), category, message,
+            data if DebugLogger.VERBOSE else None
+        ))
 
     @staticmethod
     def audio_received(session_id: str, chunk_bytes: int, duration_sec: float):
@@ -95,3 +164,33 @@ class DebugLogger:
             "total_latency_ms": f"{total_latency_ms:.0f}",
             **breakdown
         })
+
+
+if DebugLogger.ENABLED:
+    # 생산자 스레드는 QueueHandler로 enqueue만, 출력은 리스너 스레드 1개가 전담
+    # (여러 room의 파이프라인 스레드가 stdout 락에서 직렬화되지 않음)
+    _log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _stream_handler = logging.StreamHandler(sys.stdout)
+    _stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _logger = logging.getLogger("eum.debug")
+    _logger.setLevel(logging.DEBUG)
+    _logger.propagate = False
+    _logger.addHandler(_PassThroughQueueHandler(_log_queue))
+    _listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+    _listener.start()
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+if not DebugLogger.ENABLED:
+    # 비활성 시 모든 로그 메서드를 no-op으로 바인딩
+    # helper 본문의 dict 구성/포맷 비용이 통째로 사라진다
+    # (핫패스는 DebugLogger.enabled() 가드로 호출 자체도 생략)
+    for _name in (
+        "log", "audio_received", "vad_result", "stt_start", "stt_result",
+        "translation_start", "translation_result", "tts_start", "tts_result",
+        "pipeline_complete",
+    ):
+        setattr(DebugLogger, _name, staticmethod(_noop))